@@ -6,42 +6,138 @@ Monitors git repository for changes and automatically restarts the controller
 
 import os
 import sys
+import select
+import selectors
+import argparse
 import subprocess
 import time
 import signal
 import logging
-from datetime import datetime
+import logging.handlers
+import shutil
+import threading
 from pathlib import Path
 
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+    GIT_ERRORS = (subprocess.CalledProcessError, pygit2.GitError, KeyError)
+except ImportError:
+    PYGIT2_AVAILABLE = False
+    GIT_ERRORS = (subprocess.CalledProcessError,)
+
+try:
+    import pathspec
+    PATHSPEC_AVAILABLE = True
+except ImportError:
+    PATHSPEC_AVAILABLE = False
+
+try:
+    from pystemd.dbuslib import DBus
+    from pystemd.systemd1 import Manager as SystemdManager, Unit as SystemdUnit
+    PYSTEMD_AVAILABLE = True
+except ImportError:
+    PYSTEMD_AVAILABLE = False
+
+# subprocess only takes its posix_spawn fast path (instead of fork+exec) for an
+# absolute executable with no cwd= and close_fds=False, so resolve binaries once
+# and point git at the repo with -C
+GIT_BIN = shutil.which("git") or "git"
+SH_BIN = shutil.which("sh") or "sh"
+SUDO_BIN = shutil.which("sudo") or "sudo"
+SYSTEMCTL_BIN = shutil.which("systemctl") or "systemctl"
+
+# systemd reports a finished job (and its result) as a JobRemoved signal;
+# arg2 is the unit name so other units' jobs never reach the connection
+JOB_REMOVED_MATCH = (
+    "type='signal',sender='org.freedesktop.systemd1',"
+    "path='/org/freedesktop/systemd1',"
+    "interface='org.freedesktop.systemd1.Manager',member='JobRemoved',"
+    "arg2='{unit}'"
+)
+
+# Paths to watch for changes (if any of these change, restart)
+DEFAULT_WATCH_PATHS = ("rpi_driver/", "static/", "configs/", "requirements.txt")
+
+if PYGIT2_AVAILABLE:
+    class _AgentCallbacks(pygit2.RemoteCallbacks):
+        """Authenticate SSH remotes with the ssh-agent, offering the key only once"""
+
+        def __init__(self):
+            super().__init__()
+            self._tried = False
+
+        def credentials(self, url, username_from_url, allowed_types):
+            # libgit2 asks again after a rejected key, which would loop forever
+            if self._tried or not allowed_types & pygit2.enums.CredentialType.SSH_KEY:
+                raise pygit2.GitError(f"no usable credentials for {url}")
+            self._tried = True
+            return pygit2.KeypairFromAgent(username_from_url or "git")
+
 class AutoUpdater:
     def __init__(self,
                  repo_path: str = "/home/jim/Esp32-matrix",
                  service_name: str = "led-driver.service",
                  check_interval: int = 30,
                  log_file: str = "/tmp/auto_updater.log",
-                 watch_paths: list = None):
+                 watch_paths: list = None,
+                 fetch_interval: int = None,
+                 max_interval: int = 1800):
 
         self.repo_path = str(Path(repo_path).resolve())  # Convert to absolute string path
+        self._git = [GIT_BIN, "-C", self.repo_path]
         self.service_name = service_name
         self.check_interval = check_interval
+        # ls-remote is cheap and a fetch only runs when main moved, so by default the
+        # background fetcher polls as often as the check loop would have
+        self.fetch_interval = fetch_interval or check_interval
+        self.max_interval = max_interval
         self.log_file = log_file
         self.current_commit = None
+        self.remote_commit = None
         self.running = True
 
-        # Paths to watch for changes (if any of these change, restart)
-        self.watch_paths = watch_paths or [
-            "rpi_driver/",
-            "static/",
-            "configs/",
-            "requirements.txt"
-        ]
+        # Adaptive polling: back off while idle, drop back to check_interval on activity
+        self._idle_streak = 0
+        self._interval = check_interval
+
+        # HEAD lookup cache, keyed on the mtimes of the files HEAD resolves through
+        self._commit_cache_key = None
+        self._commit_cache = None
+        # Ref file mtimes as of the last check that found nothing to do
+        self._idle_ref_mtimes = None
+
+        # systemd D-Bus handle for the service (None falls back to systemctl) and
+        # the connection its job signals arrive on
+        self._unit = None
+        self._bus = None
+
+        # Long-lived git process that resolves refs without a fork per lookup
+        self._cat_file = None
+
+        # Kept as a tuple so it can be passed to str.startswith directly
+        self.watch_paths = tuple(watch_paths or DEFAULT_WATCH_PATHS)
+        self._ignore = None
         
-        # Setup logging
+        # Setup logging; file records are buffered and written in batches (or
+        # immediately on WARNING+) to keep SD card writes down, and rotated
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=1_000_000, backupCount=3, delay=True)
+        file_handler.setFormatter(logging.Formatter(log_format))
+        self._log_buffer = logging.handlers.MemoryHandler(
+            capacity=32, flushLevel=logging.WARNING, target=file_handler)
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
+            format=log_format,
             handlers=[
-                logging.FileHandler(log_file),
+                self._log_buffer,
                 logging.StreamHandler(sys.stdout)
             ]
         )
@@ -50,73 +146,389 @@ class AutoUpdater:
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGTERM, self._signal_handler)
         signal.signal(signal.SIGINT, self._signal_handler)
+
+        # Changes to gitignored files (force-added build/cache artifacts) don't count
+        self._ignore = self._load_gitignore()
+
+        self._unit = self._connect_unit()
+        # Bind the service backend once so the loop never re-checks which one is in use
+        if self._unit:
+            self._get_service_state = self._dbus_service_state
+            self._issue_restart = self._dbus_restart
+        else:
+            self._get_service_state = self._systemctl_service_state
+            self._issue_restart = self._systemctl_restart
+
+        # In-process libgit2 handle (None falls back to the git CLI); the background
+        # fetcher shares it with the main loop, so calls go through a lock
+        self._repo = self._open_repo()
+        self._repo_lock = threading.Lock()
+        if self._repo:
+            self._get_remote_commit = self._pygit2_remote_commit
+            self._fetch = self._pygit2_fetch
+            self._query = self._pygit2_query
+            self._first_watched_change = self._pygit2_first_watched_change
+
+        # Watch git refs so updates are only checked when a fetch lands
+        self._inotify = self._setup_ref_watch()
+        self._fetch_stop = threading.Event()
+        self._last_fetched_commit = None
+
+        # Signals write to a wakeup pipe so the loop's wait returns immediately
+        # instead of sleeping out the rest of the interval
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        signal.set_wakeup_fd(self._wake_w)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        if self._inotify:
+            self._selector.register(self._inotify.fileno(), selectors.EVENT_READ)
+
+    def _setup_ref_watch(self):
+        """Create inotify watches on FETCH_HEAD and origin refs (None if unavailable)"""
+        if not INOTIFY_AVAILABLE:
+            self.logger.info("inotify_simple not installed, falling back to polling")
+            return None
+
+        git_dir = Path(self.repo_path) / ".git"
+        remote_refs = git_dir / "refs" / "remotes" / "origin"
+        try:
+            remote_refs.mkdir(parents=True, exist_ok=True)
+            inotify = INotify()
+            mask = inotify_flags.MODIFY | inotify_flags.MOVED_TO | inotify_flags.CREATE
+            # FETCH_HEAD is rewritten in place, refs are replaced via lockfile rename,
+            # so watch the containing directories and filter by name
+            self._fetch_head_wd = inotify.add_watch(str(git_dir), mask)
+            self._remote_refs_wd = inotify.add_watch(str(remote_refs), mask)
+            return inotify
+        except OSError as e:
+            self.logger.warning(f"Failed to set up inotify watch, falling back to polling: {e}")
+            return None
+
+    def _wait(self, timeout: float) -> bool:
+        """
+        Wait up to timeout seconds, returning early on a signal or a ref change
+
+        Returns:
+            True if a watched git ref changed (always False without inotify)
+        """
+        deadline = time.monotonic() + timeout
+        while self.running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in self._selector.select(remaining):
+                if key.fd == self._wake_r:
+                    self._drain_wakeup()
+                elif self._is_ref_change(self._inotify.read(timeout=0)):
+                    return True
+        return False
+
+    def _drain_wakeup(self):
+        """Empty the signal wakeup pipe (the handler itself updates self.running)"""
+        try:
+            while os.read(self._wake_r, 512):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _is_ref_change(self, events) -> bool:
+        """Check inotify events for FETCH_HEAD or origin ref updates"""
+        # Other files in .git (index, ORIG_HEAD, ...) also raise events; skip those
+        for event in events:
+            if event.wd == self._remote_refs_wd:
+                return True
+            if event.wd == self._fetch_head_wd and event.name == "FETCH_HEAD":
+                return True
+        return False
+
+    def _fetch_loop(self):
+        """Background thread: periodically fetch so inotify sees remote ref updates"""
+        while not self._fetch_stop.is_set():
+            try:
+                remote_commit = self._get_remote_commit()
+                if remote_commit != self._last_fetched_commit:
+                    self._fetch()
+                    self._last_fetched_commit = remote_commit
+            except GIT_ERRORS as e:
+                self.logger.error(f"Background fetch failed: {e}")
+            self._fetch_stop.wait(self.fetch_interval)
+
+    def _get_remote_commit(self) -> str:
+        """Get the remote main commit hash without downloading any objects"""
+        result = subprocess.run(
+            [*self._git, "ls-remote", "--exit-code", "origin", "refs/heads/main"],
+            close_fds=False,
+            capture_output=True,
+            check=True
+        )
+        # Only the leading SHA is needed, so decode just that field
+        return result.stdout.split(None, 1)[0].decode()
+
+    def _fetch(self):
+        """Fetch main from origin"""
+        subprocess.run(
+            [*self._git, "fetch", "origin", "main"],
+            close_fds=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=True
+        )
     
+    def _load_gitignore(self):
+        """Compile the repository's .gitignore into an in-process matcher (None if unavailable)"""
+        gitignore = Path(self.repo_path) / ".gitignore"
+        if not PATHSPEC_AVAILABLE or not gitignore.exists():
+            return None
+        with open(gitignore) as f:
+            return pathspec.PathSpec.from_lines("gitwildmatch", f)
+
+    def _is_ignored(self, path: str) -> bool:
+        """Check a repo-relative path against .gitignore"""
+        return self._ignore is not None and self._ignore.match_file(path)
+
+    def _open_repo(self):
+        """Open the repository with pygit2 (None if unavailable)"""
+        if not PYGIT2_AVAILABLE:
+            return None
+        try:
+            return pygit2.Repository(self.repo_path)
+        except pygit2.GitError as e:
+            self.logger.warning(f"Failed to open repository with pygit2, using git CLI: {e}")
+            return None
+
+    def _use_cli_remote(self, error: Exception):
+        """Switch ls-remote and fetch to the git CLI after libgit2 fails to reach origin"""
+        # The CLI honours ~/.ssh/config, key files and credential helpers that
+        # libgit2 doesn't; dropping the instance bindings exposes the CLI methods
+        if self.__dict__.pop("_fetch", None):
+            self.logger.warning(f"pygit2 could not reach origin, using git CLI for fetches: {error}")
+        self.__dict__.pop("_get_remote_commit", None)
+
+    def _pygit2_remote_commit(self) -> str:
+        """Get the remote main commit hash without downloading any objects"""
+        try:
+            with self._repo_lock:
+                remote = self._repo.remotes["origin"]
+                if hasattr(remote, "list_heads"):
+                    heads = {head.name: head.oid
+                             for head in remote.list_heads(callbacks=_AgentCallbacks())}
+                else:  # pygit2 < 1.15
+                    heads = {head["name"]: head["oid"]
+                             for head in remote.ls_remotes(callbacks=_AgentCallbacks())}
+        except pygit2.GitError as e:
+            self._use_cli_remote(e)
+            return self._get_remote_commit()
+        if "refs/heads/main" in heads:
+            return str(heads["refs/heads/main"])
+        raise KeyError("refs/heads/main not found on origin")
+
+    def _pygit2_fetch(self):
+        """Fetch origin, updating refs/remotes/origin/*"""
+        try:
+            with self._repo_lock:
+                self._repo.remotes["origin"].fetch(callbacks=_AgentCallbacks())
+        except pygit2.GitError as e:
+            self._use_cli_remote(e)
+            self._fetch()
+
+    def _pygit2_query(self, ref: str) -> str:
+        """Resolve a ref to a commit hash in-process (None if missing)"""
+        with self._repo_lock:
+            try:
+                return str(self._repo.revparse_single(ref).id)
+            except (KeyError, pygit2.GitError):
+                return None
+
+    def _pygit2_first_watched_change(self, old: str, new: str) -> str:
+        """Return the first watched file changed between two commits (None if none)"""
+        with self._repo_lock:
+            diff = self._repo.diff(old, new, flags=pygit2.GIT_DIFF_SKIP_BINARY_CHECK)
+            for delta in diff.deltas:
+                for path in (delta.new_file.path, delta.old_file.path):
+                    if path.startswith(self.watch_paths) and not self._is_ignored(path):
+                        return path
+        return None
+
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully"""
         self.logger.info(f"Received signal {signum}, shutting down...")
         self.running = False
+        self._log_buffer.flush()
     
+    def _start_cat_file(self):
+        """Start the persistent git cat-file helper"""
+        self._cat_file = subprocess.Popen(
+            [*self._git, "cat-file", "--batch-check=%(objectname)"],
+            close_fds=False,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+
+    def _stop_cat_file(self):
+        """Shut down the git cat-file helper"""
+        if self._cat_file:
+            self._cat_file.stdin.close()
+            self._cat_file.wait()
+            self._cat_file = None
+
+    def _query(self, ref: str) -> str:
+        """Resolve a ref to a commit hash via the cat-file helper (None if missing)"""
+        for attempt in range(2):
+            if self._cat_file is None or self._cat_file.poll() is not None:
+                self._start_cat_file()
+            try:
+                self._cat_file.stdin.write(ref.encode() + b"\n")
+                self._cat_file.stdin.flush()
+                line = self._cat_file.stdout.readline()
+            except BrokenPipeError:
+                line = b""
+            if line:
+                break
+            # Helper died (EPIPE/EOF), restart it once and retry
+            self._cat_file = None
+        line = line.decode().strip()
+        if not line or line.endswith(" missing"):
+            return None
+        return line
+
     def _get_current_commit(self) -> str:
         """Get the current git commit hash"""
+        commit = self._query("HEAD")
+        if not commit:
+            self.logger.error("Failed to get current commit")
+        return commit
+
+    def _head_cache_key(self) -> tuple:
+        """Stat .git/HEAD and the branch ref it points at"""
+        git_dir = Path(self.repo_path) / ".git"
+        head = git_dir / "HEAD"
+        key = [os.stat(head).st_mtime_ns]
+        target = head.read_text().strip()
+        if target.startswith("ref: "):
+            for ref_file in (git_dir / target[5:], git_dir / "packed-refs"):
+                try:
+                    key.append(os.stat(ref_file).st_mtime_ns)
+                except FileNotFoundError:
+                    key.append(None)
+        return tuple(key)
+
+    def _ref_mtimes(self) -> tuple:
+        """Stat FETCH_HEAD, origin/main and HEAD's ref files (None if unreadable)"""
+        git_dir = Path(self.repo_path) / ".git"
         try:
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to get current commit: {e}")
+            key = []
+            for ref_file in (git_dir / "FETCH_HEAD", git_dir / "refs" / "remotes" / "origin" / "main"):
+                try:
+                    key.append(os.stat(ref_file).st_mtime_ns)
+                except FileNotFoundError:
+                    key.append(None)
+            return tuple(key) + self._head_cache_key()
+        except OSError:
             return None
-    
-    def _check_for_updates(self) -> bool:
+
+    def _cached_commit(self) -> str:
+        """Get the current commit, only calling git when HEAD's ref files changed"""
+        try:
+            key = self._head_cache_key()
+        except OSError:
+            return self._get_current_commit()
+        if key != self._commit_cache_key or self._commit_cache is None:
+            self._commit_cache = self._get_current_commit()
+            self._commit_cache_key = key
+        return self._commit_cache
+
+    def _probe(self) -> tuple:
+        """Get the service state and remote main commit from a single shell process
+
+        Returns:
+            (service_state, remote_commit), remote_commit is None if ls-remote failed
+        """
+        script = (
+            'printf "%s\\n" "$(systemctl is-active "$1")"; '
+            'git -C "$2" ls-remote --exit-code origin refs/heads/main'
+        )
+        result = subprocess.run(
+            [SH_BIN, "-c", script, "sh", self.service_name, self.repo_path],
+            close_fds=False,
+            capture_output=True
+        )
+        lines = result.stdout.split(b"\n", 1)
+        state = lines[0].strip().decode()
+        remote = lines[1].split(None, 1) if len(lines) > 1 else []
+        return state, (remote[0].decode() if remote else None)
+
+    def _first_watched_change(self, old: str, new: str) -> str:
+        """Return the first watched file changed between two commits (None if none)"""
+        # diff-tree compares the two trees directly (no rename detection) and the
+        # pathspec limits it to watched files; --quiet answers via the exit code and
+        # stops at the first difference, so the common no-change case reads nothing
+        result = subprocess.run(
+            [*self._git, "diff-tree", "-r", "--quiet", old, new, "--", *self.watch_paths],
+            close_fds=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        if result.returncode == 0:
+            return None
+        if result.returncode != 1:
+            raise subprocess.CalledProcessError(
+                result.returncode, result.args, stderr=result.stderr)
+
+        # Something changed: list the names to log one and skip gitignored files
+        result = subprocess.run(
+            [*self._git, "diff-tree", "-r", "--name-only", "--no-commit-id", "-z",
+             old, new, "--", *self.watch_paths],
+            close_fds=False,
+            capture_output=True,
+            check=True
+        )
+        for changed_file in result.stdout.split(b"\0"):
+            path = changed_file.decode(errors="replace")
+            if path and not self._is_ignored(path):
+                return path
+        return None
+
+    def _check_for_updates(self, fetch: bool = True, probed_commit: str = None) -> bool:
         """Check if there are new commits on the remote"""
+        # Without a fetch, nothing can have changed unless a ref file was rewritten
+        ref_mtimes = None
+        if not fetch:
+            ref_mtimes = self._ref_mtimes()
+            if ref_mtimes is not None and ref_mtimes == self._idle_ref_mtimes:
+                return False
+
+        has_updates = self._check_refs(fetch, probed_commit)
+        # Only remember "nothing to do" states so a failed pull is retried
+        self._idle_ref_mtimes = None if has_updates else ref_mtimes
+        return has_updates
+
+    def _check_refs(self, fetch: bool, probed_commit: str) -> bool:
+        """Compare origin/main against the current commit, fetching first if asked"""
         try:
-            # Fetch latest changes
-            subprocess.run(
-                ["git", "fetch", "origin"],
-                cwd=self.repo_path,
-                capture_output=True,
-                check=True
-            )
-            
+            # Probe the remote cheaply and only fetch when main has moved
+            # (skipped when the background fetcher already did)
+            if fetch:
+                if (probed_commit or self._get_remote_commit()) == self.current_commit:
+                    return False
+                self._fetch()
+
             # Get remote commit hash
-            result = subprocess.run(
-                ["git", "rev-parse", "origin/main"],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            remote_commit = result.stdout.strip()
-            
+            remote_commit = self._query("origin/main")
+            if not remote_commit:
+                self.logger.error("Failed to resolve origin/main")
+                return False
+            self.remote_commit = remote_commit
+
             # Check if watched paths were modified
             if self.current_commit and remote_commit != self.current_commit:
                 # Check if any watched paths were modified in the new commits
-                result = subprocess.run(
-                    ["git", "diff", "--name-only", f"{self.current_commit}..{remote_commit}"],
-                    cwd=self.repo_path,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-
-                changed_files = result.stdout.strip().split('\n')
-
-                # Check if any changed file is in our watch paths
-                relevant_change = False
-                for changed_file in changed_files:
-                    for watch_path in self.watch_paths:
-                        if changed_file.startswith(watch_path):
-                            relevant_change = True
-                            self.logger.info(f"Watched file changed: {changed_file}")
-                            break
-                    if relevant_change:
-                        break
-
-                if relevant_change:
+                changed_file = self._first_watched_change(self.current_commit, remote_commit)
+
+                if changed_file:
+                    self.logger.info(f"Watched file changed: {changed_file}")
                     self.logger.info(f"Relevant changes detected in commit {remote_commit}")
                     return True
                 else:
@@ -126,7 +538,7 @@ class AutoUpdater:
             
             return remote_commit != self.current_commit
             
-        except subprocess.CalledProcessError as e:
+        except GIT_ERRORS as e:
             self.logger.error(f"Failed to check for updates: {e}")
             return False
     
@@ -134,45 +546,115 @@ class AutoUpdater:
         """Pull the latest changes from git"""
         try:
             subprocess.run(
-                ["git", "pull", "origin", "main"],
-                cwd=self.repo_path,
-                capture_output=True,
+                [*self._git, "pull", "origin", "main"],
+                close_fds=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=True
             )
-            self.current_commit = self._get_current_commit()
+            # The pull may merge rather than fast-forward, so read HEAD back; the ref
+            # mtime can land in the same tick as before, so drop the cache key first
+            self._commit_cache_key = None
+            self.current_commit = self._cached_commit()
             self.logger.info(f"Successfully pulled updates, now at commit {self.current_commit}")
             return True
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to pull updates: {e}")
+            self.logger.error(f"Failed to pull updates: {e} {e.stderr.decode(errors='replace').strip()}")
             return False
     
+    def _connect_unit(self):
+        """Open the service unit over the systemd D-Bus API (None if unavailable)"""
+        if not PYSTEMD_AVAILABLE:
+            return None
+        try:
+            # Job signals are only sent once a client subscribes; issue the restart on
+            # the same connection so the JobRemoved for it is queued there too
+            bus = DBus()
+            bus.open()
+            bus.add_match(JOB_REMOVED_MATCH.format(unit=self.service_name).encode())
+            SystemdManager(bus=bus, _autoload=True).Manager.Subscribe()
+            unit = SystemdUnit(self.service_name.encode(), bus=bus, _autoload=True)
+            self._bus = bus
+            return unit
+        except Exception as e:
+            self.logger.warning(f"Failed to connect to systemd over D-Bus, using systemctl: {e}")
+            return None
+
+    def _dbus_service_state(self) -> str:
+        """Get the unit's ActiveState (active, failed, activating, ...) over D-Bus"""
+        return self._unit.Unit.ActiveState.decode()
+
+    def _systemctl_service_state(self) -> str:
+        """Get the unit's ActiveState (active, failed, activating, ...) via systemctl"""
+        result = subprocess.run(
+            [SYSTEMCTL_BIN, "is-active", self.service_name],
+            close_fds=False,
+            capture_output=True,
+            text=True
+        )
+        return result.stdout.strip()
+
+    def _dbus_restart(self, timeout: float = 30.0):
+        """Restart over D-Bus, blocking until systemd reports the job finished"""
+        # Drop signals left over from earlier jobs (e.g. systemd's own auto-restarts)
+        while not self._bus.process().is_empty():
+            pass
+        job = self._unit.Unit.Restart(b"replace")
+        deadline = time.monotonic() + timeout
+        fd = self._bus.get_fd()
+        while True:
+            msg = self._bus.process()
+            if msg.is_empty():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"restart job {job.decode()} still running after {timeout}s")
+                select.select([fd], [], [], remaining)
+                continue
+            msg.process_reply(True)
+            # JobRemoved carries (id, job path, unit name, result)
+            body = msg.body
+            if len(body) == 4 and body[1] == job:
+                result = body[3].decode()
+                if result != "done":
+                    raise RuntimeError(f"restart job finished with result '{result}'")
+                return
+
+    def _systemctl_restart(self):
+        """Restart via systemctl (blocks until the job finishes)"""
+        subprocess.run(
+            [SUDO_BIN, SYSTEMCTL_BIN, "restart", self.service_name],
+            close_fds=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=True
+        )
+
     def _restart_service(self) -> bool:
-        """Restart the systemd service"""
+        """Restart the systemd service and wait until it is active again"""
         try:
             self.logger.info(f"Restarting service {self.service_name}...")
-            subprocess.run(
-                ["sudo", "systemctl", "restart", self.service_name],
-                cwd=self.repo_path,
-                capture_output=True,
-                check=True
-            )
+            # Both backends return only once the restart job has completed
+            self._issue_restart()
+            state = self._get_service_state()
+            if state != "active":
+                self.logger.error(f"Service {self.service_name} did not come up: {state}")
+                return False
             self.logger.info(f"Service {self.service_name} restarted successfully")
             return True
         except subprocess.CalledProcessError as e:
+            self.logger.error(f"Failed to restart service: {e} {e.stderr.decode(errors='replace').strip()}")
+            return False
+        except Exception as e:
             self.logger.error(f"Failed to restart service: {e}")
             return False
 
-    def _check_service_health(self) -> bool:
-        """Check if the systemd service is running"""
+    def _check_service_health(self, state: str = None) -> bool:
+        """Check if the systemd service is running (state may come from _probe)"""
         try:
-            result = subprocess.run(
-                ["systemctl", "is-active", self.service_name],
-                capture_output=True,
-                text=True
-            )
-            is_active = result.stdout.strip() == "active"
+            state = state or self._get_service_state()
+            is_active = state == "active"
             if not is_active:
-                self.logger.warning(f"Service {self.service_name} is not active: {result.stdout.strip()}")
+                self.logger.warning(f"Service {self.service_name} is not active: {state}")
             return is_active
         except Exception as e:
             self.logger.error(f"Failed to check service health: {e}")
@@ -185,7 +667,7 @@ class AutoUpdater:
         self.logger.info(f"Watching paths: {', '.join(self.watch_paths)}")
 
         # Get initial commit
-        self.current_commit = self._get_current_commit()
+        self.current_commit = self._cached_commit()
         if not self.current_commit:
             self.logger.error("Failed to get initial commit, exiting")
             return
@@ -196,45 +678,85 @@ class AutoUpdater:
         if not self._check_service_health():
             self.logger.warning("Service not running at startup")
 
+        if self._inotify:
+            self.logger.info(f"Watching git refs via inotify, fetching every {self.fetch_interval}s")
+            threading.Thread(target=self._fetch_loop, daemon=True).start()
+        refs_changed = True
+        retry_check = False
+
         # Main monitoring loop
         while self.running:
             try:
+                # When both the health check and the remote probe would fork,
+                # fold them into one shell process
+                state = probed_commit = None
+                if not self._inotify and not self._unit and not self._repo:
+                    state, probed_commit = self._probe()
+
+                commit_before = self.current_commit
+                active = refs_changed and bool(self._inotify)
+
                 # Check if service is still running
-                if not self._check_service_health():
+                if not self._check_service_health(state):
+                    active = True
                     self.logger.info("Service not running, attempting restart...")
                     if not self._restart_service():
                         self.logger.error("Failed to restart service")
-                        time.sleep(self.check_interval)
-                        continue
 
-                # Check for updates
-                if self._check_for_updates():
+                # Check for updates (inotify mode only checks after a ref change)
+                if not self._inotify:
+                    has_updates = self._check_for_updates(probed_commit=probed_commit)
+                elif refs_changed:
+                    has_updates = self._check_for_updates(fetch=False)
+                else:
+                    has_updates = False
+
+                retry_check = False
+                if has_updates:
                     self.logger.info("Updates found, pulling and restarting...")
 
                     # Pull updates
+                    retry_check = True
                     if self._pull_updates():
+                        retry_check = False
                         # Restart service with new code
                         if not self._restart_service():
                             self.logger.error("Failed to restart service with updates")
                     else:
                         self.logger.error("Failed to pull updates")
 
-                # Wait before next check
-                time.sleep(self.check_interval)
+                # Any remote movement, restart or failure resets the backoff
+                if active or has_updates or retry_check or self.current_commit != commit_before:
+                    self._idle_streak = 0
+                    self._interval = self.check_interval
+                else:
+                    self._idle_streak += 1
+                    self._interval = min(self.check_interval * 2 ** min(self._idle_streak, 6),
+                                         max(self.max_interval, self.check_interval))
+
+                # Wait before next check; the interval caps the wait so the
+                # service health check still runs
+                refs_changed = self._wait(self._interval) or retry_check
 
             except KeyboardInterrupt:
                 self.logger.info("Keyboard interrupt received, shutting down...")
                 break
             except Exception as e:
                 self.logger.error(f"Unexpected error in main loop: {e}")
-                time.sleep(self.check_interval)
+                self._idle_streak = 0
+                self._interval = self.check_interval
+                self._wait(self.check_interval)
 
+        self._fetch_stop.set()
+        self._stop_cat_file()
+        self._selector.close()
+        if self._bus:
+            self._bus.close()
         self.logger.info("Auto-updater stopped")
+        self._log_buffer.flush()
 
-def main():
-    """Main entry point"""
-    import argparse
-
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
     parser = argparse.ArgumentParser(description="Auto-updater for LED Display Driver")
     parser.add_argument("--repo-path", default="/home/jim/Esp32-matrix",
                        help="Path to git repository")
@@ -242,20 +764,32 @@ def main():
                        help="Systemd service name to monitor and restart")
     parser.add_argument("--interval", type=int, default=30,
                        help="Check interval in seconds")
+    parser.add_argument("--max-interval", type=int, default=1800,
+                       help="Longest check interval in seconds when backing off while idle")
+    parser.add_argument("--fetch-interval", type=int, default=None,
+                       help="Background git fetch interval in seconds in inotify mode "
+                            "(defaults to --interval)")
     parser.add_argument("--log-file", default="/tmp/auto_updater.log",
                        help="Log file path")
     parser.add_argument("--watch-paths", nargs="+",
-                       default=["rpi_driver/", "static/", "configs/", "requirements.txt"],
+                       default=DEFAULT_WATCH_PATHS,
                        help="Paths to watch for changes")
+    return parser
 
-    args = parser.parse_args()
+_PARSER = _build_parser()
+
+def main():
+    """Main entry point"""
+    args = _PARSER.parse_args()
 
     updater = AutoUpdater(
         repo_path=args.repo_path,
         service_name=args.service,
         check_interval=args.interval,
         log_file=args.log_file,
-        watch_paths=args.watch_paths
+        watch_paths=args.watch_paths,
+        fetch_interval=args.fetch_interval,
+        max_interval=args.max_interval
     )
 
     updater.run()
@@ -4,22 +4,99 @@ Configuration Manager for LED Panel System
 Handles loading, saving, validating, and backing up panel configurations
 """
 
+import copy
 import json
 import os
 import shutil
+from collections import deque
 from datetime import datetime
 from typing import Tuple, Dict, Any
 from pathlib import Path
 
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers are unaffected
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
 
 class ConfigManager:
     """Manages panel configuration files with validation and backup"""
 
+    # Structural checks for validate_config's fast path; cross-field checks
+    # (grid bounds, duplicate IDs, overlaps) can't be expressed here
+    _SCHEMA = {
+        "type": "object",
+        "required": ["grid", "panels"],
+        "properties": {
+            "grid": {
+                "type": "object",
+                "required": ["grid_width", "grid_height", "panel_width", "panel_height"],
+                "properties": {
+                    key: {"type": "integer", "minimum": 1}
+                    for key in ("grid_width", "grid_height", "panel_width", "panel_height")
+                },
+            },
+            "panels": {
+                "type": "array",
+                "minItems": 1,
+                "items": {
+                    "type": "object",
+                    "required": ["id", "position", "rotation"],
+                    "properties": {
+                        "id": {"type": "integer", "minimum": 0},
+                        "position": {
+                            "type": "array",
+                            "minItems": 2,
+                            "maxItems": 2,
+                            "items": {"type": "integer", "minimum": 0},
+                        },
+                        "rotation": {"enum": [0, 90, 180, 270]},
+                    },
+                },
+            },
+        },
+    }
+
+    MAX_BACKUPS = 10  # Backups kept in backup_dir
+
+    # Compiled once per process and shared by all instances
+    _schema_validator = None
+
+    # Parsed, validated configs keyed by resolved path -> (mtime_ns, size, config),
+    # shared so short-lived instances (e.g. config reloads) hit it too
+    _cache: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+
     def __init__(self, config_dir: str = "configs"):
         self.config_dir = Path(config_dir)
         self.backup_dir = self.config_dir / "backup"
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
+        # Backups oldest-first; scanned from disk on first backup only
+        self._backup_ring = None
+
+        if FASTJSONSCHEMA_AVAILABLE and ConfigManager._schema_validator is None:
+            ConfigManager._schema_validator = fastjsonschema.compile(self._SCHEMA)
+
     def load_config(self, config_path: str) -> Dict[str, Any]:
         """
         Load configuration from JSON file
@@ -40,18 +117,33 @@ class ConfigManager:
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        # Unchanged file: skip reading, parsing and validation
+        cache_key = config_path.resolve()
+        st = config_path.stat()
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return copy.deepcopy(cached[2])
+
+        with open(config_path, 'rb') as f:
+            config = _loads(f.read())
 
         # Validate configuration
         is_valid, error_msg = self.validate_config(config)
         if not is_valid:
             raise ValueError(f"Invalid configuration: {error_msg}")
 
+        # Cache a private copy so callers can modify the returned dict
+        self._cache[cache_key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(config))
+
         return config
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached configurations so the next load reads from disk"""
+        cls._cache.clear()
+
     def save_config(self, config: Dict[str, Any], config_path: str,
-                   create_backup: bool = True) -> None:
+                   create_backup: bool = True, validated: bool = False) -> None:
         """
         Save configuration to JSON file
 
@@ -59,14 +151,17 @@ class ConfigManager:
             config: Configuration dictionary
             config_path: Path to save configuration
             create_backup: If True, backup existing file before overwriting
+            validated: True if the caller already ran validate_config on this
+                exact (unmodified) config, to skip validating it again
 
         Raises:
             ValueError: If config fails validation
         """
         # Validate before saving
-        is_valid, error_msg = self.validate_config(config)
-        if not is_valid:
-            raise ValueError(f"Cannot save invalid configuration: {error_msg}")
+        if not validated:
+            is_valid, error_msg = self.validate_config(config)
+            if not is_valid:
+                raise ValueError(f"Cannot save invalid configuration: {error_msg}")
 
         config_path = Path(config_path)
 
@@ -74,10 +169,28 @@ class ConfigManager:
         if create_backup and config_path.exists():
             self.backup_config(config_path)
 
-        # Save config
+        # Save config atomically: write a temp file, then swap it into place
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        tmp_path = config_path.with_name(config_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(config))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, config_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        # Persist the rename itself, not just the file contents
+        dir_fd = os.open(config_path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+        # Don't rely on mtime granularity to notice the rewrite
+        self._cache.pop(config_path.resolve(), None)
 
     def backup_config(self, config_path: Path) -> Path:
         """
@@ -93,21 +206,22 @@ class ConfigManager:
         backup_name = f"{config_path.stem}_{timestamp}.json"
         backup_path = self.backup_dir / backup_name
 
+        # A real copy: a hard link would share the inode with the live file and be
+        # rewritten along with it by anything that edits in place (configurator, nano)
         shutil.copy2(config_path, backup_path)
 
-        # Keep only last 10 backups
-        self._cleanup_old_backups(max_backups=10)
+        # Keep only the last MAX_BACKUPS backups
+        if self._backup_ring is None:
+            # Backups share the source's mtime, so order the new one last explicitly
+            existing = [p for p in self.backup_dir.glob("*.json") if p != backup_path]
+            self._backup_ring = deque(sorted(existing, key=lambda p: p.stat().st_mtime_ns))
+        if backup_path not in self._backup_ring:
+            self._backup_ring.append(backup_path)
 
-        return backup_path
-
-    def _cleanup_old_backups(self, max_backups: int = 10):
-        """Remove old backup files, keeping only the most recent"""
-        backups = sorted(self.backup_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        while len(self._backup_ring) > self.MAX_BACKUPS:
+            self._backup_ring.popleft().unlink(missing_ok=True)
 
-        # Remove oldest backups if we exceed max_backups
-        while len(backups) > max_backups:
-            oldest = backups.pop(0)
-            oldest.unlink()
+        return backup_path
 
     def validate_config(self, config: Dict[str, Any]) -> Tuple[bool, str]:
         """
@@ -119,6 +233,16 @@ class ConfigManager:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        # Fast path: compiled schema plus cross-field checks. Anything the
+        # schema rejects goes through the full checks below for the exact error.
+        if self._schema_validator is not None:
+            try:
+                self._schema_validator(config)
+            except fastjsonschema.JsonSchemaException:
+                pass
+            else:
+                return self._validate_layout(config)
+
         # Check required top-level keys
         required_keys = ['grid', 'panels']
         for key in required_keys:
@@ -142,12 +266,11 @@ class ConfigManager:
         if len(panels) == 0:
             return False, "Configuration must have at least one panel"
 
-        # Check for duplicate panel IDs
-        panel_ids = [p.get('id') for p in panels]
-        if len(panel_ids) != len(set(panel_ids)):
-            return False, "Duplicate panel IDs found"
+        grid_width, grid_height = grid['grid_width'], grid['grid_height']
 
-        # Validate each panel
+        # Validate each panel, collecting IDs and positions to catch duplicates in the same pass
+        seen_ids = set()
+        seen_positions = set()
         for i, panel in enumerate(panels):
             # Check required panel keys
             panel_required = ['id', 'position', 'rotation']
@@ -171,7 +294,7 @@ class ConfigManager:
             if pos_x < 0 or pos_y < 0:
                 return False, f"Panel {i}: position coordinates must be non-negative"
 
-            if pos_x >= grid['grid_width'] or pos_y >= grid['grid_height']:
+            if pos_x >= grid_width or pos_y >= grid_height:
                 return False, f"Panel {i}: position {position} exceeds grid dimensions"
 
             # Validate rotation
@@ -180,10 +303,45 @@ class ConfigManager:
             if rotation not in valid_rotations:
                 return False, f"Panel {i}: rotation must be one of {valid_rotations}"
 
-        # Check for overlapping panels
-        panel_positions = [(p['position'][0], p['position'][1]) for p in panels]
-        if len(panel_positions) != len(set(panel_positions)):
-            return False, "Panels have overlapping positions"
+            # Check for duplicate IDs and overlapping panels
+            if panel['id'] in seen_ids:
+                return False, "Duplicate panel IDs found"
+            seen_ids.add(panel['id'])
+
+            if (pos_x, pos_y) in seen_positions:
+                return False, "Panels have overlapping positions"
+            seen_positions.add((pos_x, pos_y))
+
+        return True, ""
+
+    def _validate_layout(self, config: Dict[str, Any]) -> Tuple[bool, str]:
+        """
+        Cross-field checks for a configuration that already matches _SCHEMA
+
+        Args:
+            config: Structurally valid configuration dictionary
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        grid_width = config['grid']['grid_width']
+        grid_height = config['grid']['grid_height']
+
+        seen_ids = set()
+        seen_positions = set()
+        for i, panel in enumerate(config['panels']):
+            position = panel['position']
+            pos_x, pos_y = position
+            if pos_x >= grid_width or pos_y >= grid_height:
+                return False, f"Panel {i}: position {position} exceeds grid dimensions"
+
+            if panel['id'] in seen_ids:
+                return False, "Duplicate panel IDs found"
+            seen_ids.add(panel['id'])
+
+            if (pos_x, pos_y) in seen_positions:
+                return False, "Panels have overlapping positions"
+            seen_positions.add((pos_x, pos_y))
 
         return True, ""
 
@@ -225,10 +383,10 @@ def load_config(config_path: str) -> Dict[str, Any]:
 
 
 def save_config(config: Dict[str, Any], config_path: str,
-               create_backup: bool = True) -> None:
+               create_backup: bool = True, validated: bool = False) -> None:
     """Save configuration to file"""
     manager = ConfigManager()
-    manager.save_config(config, config_path, create_backup)
+    manager.save_config(config, config_path, create_backup, validated)
 
 
 def validate_config(config: Dict[str, Any]) -> Tuple[bool, str]:
@@ -51,7 +51,12 @@ class CoordinateMapper:
         self.total_leds = len(self.panels) * self.panel_width * self.panel_height
 
         # Build lookup table
-        self.lut = None
+        self.lut_y = None
+        self.lut_x = None
+        self.lut_flat = None
+        self.input_shape = None
+        self.inverse_lut = None
+        self.physical_frame = None
         self.build_lookup_table()
 
         logger.info(f"Coordinate mapper initialized: {self.total_width}x{self.total_height} "
@@ -61,13 +66,16 @@ class CoordinateMapper:
         """
         Build lookup table for fast coordinate mapping
 
-        Lookup table structure: lut[physical_led_index] = (virtual_y, virtual_x)
+        Lookup table structure: (lut_y[physical_led_index], lut_x[physical_led_index])
+        = (virtual_y, virtual_x), stored as two contiguous index arrays
         """
         with self.lock:
             logger.info("Building coordinate lookup table...")
 
             # Initialize lookup table: [physical_index] -> (virt_y, virt_x)
-            self.lut = np.zeros((self.total_leds, 2), dtype=np.int16)
+            # intp so map_frame can index with them without a per-frame cast
+            self.lut_y = np.zeros(self.total_leds, dtype=np.intp)
+            self.lut_x = np.zeros(self.total_leds, dtype=np.intp)
 
             physical_index = 0
 
@@ -86,53 +94,77 @@ class CoordinateMapper:
                 logger.debug(f"Panel {panel_id}: position=[{pos_x},{pos_y}], "
                            f"rotation={rotation}, base=({base_x},{base_y})")
 
-                # Iterate through each LED in this panel (physical order)
+                # Map every LED in this panel at once (physical order)
                 leds_per_panel = self.panel_width * self.panel_height
-                for led_idx in range(leds_per_panel):
-                    # Decode LED index to panel-local coordinates
-                    local_x, local_y = self._decode_led_index(
-                        led_idx, self.panel_width, self.panel_height
-                    )
-
-                    # Apply rotation transformation
-                    rotated_x, rotated_y = self._apply_rotation(
-                        local_x, local_y, rotation,
-                        self.panel_width, self.panel_height
-                    )
-
-                    # Translate to virtual coordinates
-                    virt_x = base_x + rotated_x
-                    virt_y = base_y + rotated_y
-
-                    # Store in lookup table
-                    if physical_index < self.total_leds:
-                        self.lut[physical_index] = [virt_y, virt_x]
-                        physical_index += 1
+                led_idx = np.arange(leds_per_panel)
+
+                # Decode LED indices to panel-local coordinates
+                local_x, local_y = self._decode_led_index(
+                    led_idx, self.panel_width, self.panel_height
+                )
+
+                # Apply rotation transformation
+                rotated_x, rotated_y = self._apply_rotation(
+                    local_x, local_y, rotation,
+                    self.panel_width, self.panel_height
+                )
+
+                # Translate to virtual coordinates and store in lookup table
+                end_index = physical_index + leds_per_panel
+                self.lut_y[physical_index:end_index] = base_y + rotated_y
+                self.lut_x[physical_index:end_index] = base_x + rotated_x
+                physical_index = end_index
+
+            # Fold the global display rotation into the gather indices, so
+            # map_frame reads the incoming (unrotated) frame directly
+            h, w = self.total_height, self.total_width
+            if self.display_rotation == 90:
+                src_y, src_x, src_w = self.lut_x, h - 1 - self.lut_y, h
+                self.input_shape = (w, h, 3)
+            elif self.display_rotation == 180:
+                src_y, src_x, src_w = h - 1 - self.lut_y, w - 1 - self.lut_x, w
+                self.input_shape = (h, w, 3)
+            elif self.display_rotation == 270:
+                src_y, src_x, src_w = w - 1 - self.lut_x, self.lut_y, h
+                self.input_shape = (w, h, 3)
+            else:
+                src_y, src_x, src_w = self.lut_y, self.lut_x, w
+                self.input_shape = (h, w, 3)
+
+            # Row-major offsets into a (rows*cols, 3) view of the incoming frame
+            self.lut_flat = src_y * src_w + src_x
+
+            # Inverse table: inverse_lut[virt_y, virt_x] -> physical index (-1 if unused).
+            # Filled in reverse so the lowest index wins if panels overlap.
+            self.inverse_lut = np.full((self.total_height, self.total_width), -1, dtype=np.intp)
+            self.inverse_lut[self.lut_y[::-1], self.lut_x[::-1]] = np.arange(self.total_leds)[::-1]
+
+            # Output buffer reused by every map_frame call
+            self.physical_frame = np.zeros((self.total_leds, 3), dtype=np.uint8)
 
             logger.info(f"Lookup table built: {physical_index} LED mappings")
 
-    def _decode_led_index(self, idx: int, width: int, height: int) -> Tuple[int, int]:
+    def _decode_led_index(self, idx: np.ndarray, width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Convert LED index to panel-local coordinates
+        Convert LED indices to panel-local coordinates
 
         Assumes serpentine (zigzag) wiring:
         - Even rows: left to right (0→width-1)
         - Odd rows: right to left (width-1→0)
 
         Args:
-            idx: LED index within panel (0 to width*height-1)
+            idx: Array of LED indices within panel (0 to width*height-1)
             width: Panel width in pixels
             height: Panel height in pixels
 
         Returns:
-            Tuple of (x, y) panel-local coordinates
+            Tuple of (x, y) arrays of panel-local coordinates
         """
         row = idx // width
         col = idx % width
 
         # Serpentine: reverse direction on odd rows
-        if row % 2 == 1:
-            col = width - 1 - col
+        col = np.where(row % 2 == 1, width - 1 - col, col)
 
         return col, row
 
@@ -142,8 +174,8 @@ class CoordinateMapper:
         Apply rotation transformation to coordinates
 
         Args:
-            x: X coordinate
-            y: Y coordinate
+            x: X coordinate(s), scalar or array
+            y: Y coordinate(s), scalar or array
             rotation: Rotation angle (0, 90, 180, 270)
             width: Panel width
             height: Panel height
@@ -171,42 +203,31 @@ class CoordinateMapper:
         Map virtual frame to physical LED order
 
         Uses pre-computed lookup table for fast mapping
-        Applies global display rotation before mapping
+        Global display rotation is applied through the same table
 
         Args:
             virtual_frame: NumPy array of shape (height, width, 3) with RGB values
                           e.g., (32, 32, 3) for 2x2 grid of 16x16 panels
 
         Returns:
-            physical_frame: NumPy array of shape (total_leds, 3) in physical LED order
+            physical_frame: NumPy array of shape (total_leds, 3) in physical LED order.
+                            The same buffer is reused (overwritten) on the next call.
         """
         with self.lock:
-            # Apply global display rotation
-            if self.display_rotation == 90:
-                virtual_frame = np.rot90(virtual_frame, k=1, axes=(0, 1))
-            elif self.display_rotation == 180:
-                virtual_frame = np.rot90(virtual_frame, k=2, axes=(0, 1))
-            elif self.display_rotation == 270:
-                virtual_frame = np.rot90(virtual_frame, k=3, axes=(0, 1))
-            # k=0 or rotation=0 means no rotation
-
-            # Validate frame dimensions
-            expected_shape = (self.total_height, self.total_width, 3)
-            if virtual_frame.shape != expected_shape:
+            # Global display rotation is already baked into lut_flat, so
+            # the frame is validated and read in its incoming orientation
+            if virtual_frame.shape != self.input_shape:
                 logger.error(f"Invalid frame shape: {virtual_frame.shape}, "
-                           f"expected {expected_shape}")
+                           f"expected {self.input_shape}")
                 # Return black frame
                 return np.zeros((self.total_leds, 3), dtype=np.uint8)
 
-            # Use lookup table for vectorized mapping
-            # Extract virtual coordinates from lookup table
-            virt_y = self.lut[:, 0]
-            virt_x = self.lut[:, 1]
-
-            # Map pixels using advanced indexing
-            physical_frame = virtual_frame[virt_y, virt_x].copy()
+            # Use lookup table for vectorized mapping, gathering straight
+            # into the preallocated output buffer
+            np.take(virtual_frame.reshape(-1, 3), self.lut_flat, axis=0,
+                    out=self.physical_frame)
 
-            return physical_frame
+            return self.physical_frame
 
     def reload_config(self, config: Dict[str, Any]) -> None:
         """
@@ -274,14 +295,8 @@ class CoordinateMapper:
         if not (0 <= x < self.total_width and 0 <= y < self.total_height):
             return -1
 
-        # Search lookup table for matching coordinates
         with self.lock:
-            for physical_idx in range(self.total_leds):
-                virt_y, virt_x = self.lut[physical_idx]
-                if virt_x == x and virt_y == y:
-                    return physical_idx
-
-        return -1
+            return int(self.inverse_lut[y, x])
 
 
 def create_test_frame(width: int, height: int, pattern: str = "gradient") -> np.ndarray:
@@ -9,7 +9,6 @@ import time
 import threading
 import queue
 import numpy as np
-from typing import Optional
 
 from .led_driver import LEDDriver
 from .coordinate_mapper import CoordinateMapper
@@ -27,6 +26,9 @@ class DisplayController:
     Supports hot-reload of configuration without restart
     """
 
+    # Longest an idle loop blocks on the queue before re-checking stop/reload
+    IDLE_TIMEOUT = 0.1
+
     def __init__(self,
                  led_driver: LEDDriver,
                  mapper: CoordinateMapper,
@@ -63,13 +65,18 @@ class DisplayController:
 
         # Statistics
         self.frame_count = 0
-        self.last_fps_time = time.time()
+        self.last_fps_time = time.monotonic()
         self.current_fps = 0.0
         self.dropped_frames = 0
 
-        # Frame timing
+        # Frame timing (monotonic deadline for the next frame)
         self.frame_interval = 1.0 / target_fps if target_fps > 0 else 0
-        self.last_frame_time = 0
+        self.next_frame_time = 0.0
+
+        # Last frame shown and the brightness it was shown at, so repeats
+        # of static content can skip the strip update
+        self._last_frame = None
+        self._last_brightness = None
 
         # Power limiter
         led_count = led_driver.get_led_count()
@@ -89,6 +96,7 @@ class DisplayController:
             return
 
         self.running = True
+        self._last_frame = None
         self.thread = threading.Thread(target=self._run_loop, daemon=True)
         self.thread.start()
         logger.info("Display controller started")
@@ -120,16 +128,19 @@ class DisplayController:
                 if self.config_reload_event.is_set():
                     self._handle_config_reload()
 
-                # Get frame from queue (non-blocking with timeout)
+                # Block until a frame arrives instead of polling every 10ms
                 try:
-                    frame = self.frame_queue.get(block=True, timeout=0.01)
-                    self._display_frame(frame)
+                    frame = self.frame_queue.get(block=True, timeout=self.IDLE_TIMEOUT)
                 except queue.Empty:
-                    # No frame available, continue
-                    pass
+                    frame = None
+
+                if frame is not None:
+                    # Skip a backlog straight to the newest frame
+                    frame = self._drain_to_latest(frame)
+                    self._display_frame(frame)
 
-                # Maintain frame rate
-                self._maintain_frame_rate()
+                    # Maintain frame rate
+                    self._maintain_frame_rate()
 
                 # Update FPS statistics
                 self._update_fps_stats()
@@ -140,6 +151,24 @@ class DisplayController:
 
         logger.info("Display loop ended")
 
+    def _drain_to_latest(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Discard queued frames older than the newest one
+
+        Args:
+            frame: Frame just taken from the queue
+
+        Returns:
+            Newest frame available, counting the rest as dropped
+        """
+        while True:
+            try:
+                newer = self.frame_queue.get_nowait()
+            except queue.Empty:
+                return frame
+            frame = newer
+            self.dropped_frames += 1
+
     def _handle_config_reload(self) -> None:
         """Handle configuration reload event"""
         try:
@@ -155,6 +184,7 @@ class DisplayController:
 
             # Reload mapper with new configuration
             self.mapper.reload_config(new_config)
+            self._last_frame = None
 
             # Clear reload event
             self.config_reload_event.clear()
@@ -173,46 +203,67 @@ class DisplayController:
             virtual_frame: Frame in virtual coordinate space
         """
         try:
-            # Map virtual frame to physical LED order
-            physical_frame = self.mapper.map_frame(virtual_frame)
-
-            # Apply power limiting if enabled
+            # Repeated content is already mapped and in the LED driver's buffer
+            repeated = (self._last_frame is not None
+                        and np.array_equal(virtual_frame, self._last_frame))
+
+            if repeated:
+                physical_frame = self.led_driver.current_frame
+            else:
+                # Map virtual frame to physical LED order
+                physical_frame = self.mapper.map_frame(virtual_frame)
+
+            # Apply power limiting if enabled (also for repeats, so limit
+            # changes and dynamic-mode steps reach static content)
             current_brightness = self.led_driver.get_brightness()
             safe_brightness, was_limited = self.power_limiter.limit_brightness_for_frame(
                 physical_frame,
-                current_brightness
+                current_brightness,
+                frame_unchanged=repeated
             )
 
             # Apply limited brightness if needed
             if was_limited:
                 self.led_driver.set_brightness(safe_brightness)
 
+            # Same content at the same brightness is already on the LEDs
+            if repeated and self.led_driver.get_brightness() == self._last_brightness:
+                self.frame_count += 1
+                return
+
             # Send to LED driver
-            self.led_driver.set_frame(physical_frame)
+            if not repeated:
+                self.led_driver.set_frame(physical_frame)
             self.led_driver.show()
 
+            # Keep a private copy; producers may reuse their frame buffers
+            if not repeated:
+                self._last_frame = np.array(virtual_frame)
+            self._last_brightness = self.led_driver.get_brightness()
+
             self.frame_count += 1
 
         except Exception as e:
             logger.error(f"Error displaying frame: {e}", exc_info=True)
 
     def _maintain_frame_rate(self) -> None:
-        """Maintain target frame rate"""
+        """Maintain target frame rate on a fixed, drift-free schedule"""
         if self.frame_interval <= 0:
             return
 
-        current_time = time.time()
-        elapsed = current_time - self.last_frame_time
+        current_time = time.monotonic()
 
-        if elapsed < self.frame_interval:
-            sleep_time = self.frame_interval - elapsed
-            time.sleep(sleep_time)
-
-        self.last_frame_time = time.time()
+        if current_time < self.next_frame_time:
+            time.sleep(self.next_frame_time - current_time)
+            self.next_frame_time += self.frame_interval
+        else:
+            # Late (or idle): skip the missed slots rather than bursting to catch up
+            missed = int((current_time - self.next_frame_time) // self.frame_interval)
+            self.next_frame_time += self.frame_interval * (missed + 1)
 
     def _update_fps_stats(self) -> None:
         """Update FPS statistics"""
-        current_time = time.time()
+        current_time = time.monotonic()
         elapsed = current_time - self.last_fps_time
 
         if elapsed >= 1.0:  # Update every second
@@ -9,9 +9,7 @@ Date: 2025-12-29
 """
 
 import numpy as np
-import math
 from typing import Tuple, List
-import colorsys
 
 
 class Blob:
@@ -314,10 +312,8 @@ class FluidSimulation:
         Returns:
             128x128 RGB frame (height, width, 3) uint8
         """
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-
         # Dark background
-        frame[:, :] = [10, 0, 20]
+        frame = np.full((self.height, self.width, 3), [10, 0, 20], dtype=np.uint8)
 
         # Render blobs using metaball algorithm
         for y in range(self.height):
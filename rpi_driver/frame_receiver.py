@@ -5,10 +5,12 @@ Handles UDP and named pipe protocols for receiving frames
 """
 
 import logging
+import selectors
 import socket
 import threading
 import queue
 import struct
+import time
 import os
 import numpy as np
 from pathlib import Path
@@ -16,6 +18,9 @@ from typing import Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# UDP frame header: magic, width, height (big-endian)
+_FRAME_HDR = struct.Struct('>IHH')
+
 
 class UDPFrameReceiver:
     """
@@ -29,7 +34,10 @@ class UDPFrameReceiver:
     """
 
     MAGIC = b'LEDF'
-    HEADER_SIZE = 8  # 4 bytes magic + 2 bytes width + 2 bytes height
+    _MAGIC_INT = 0x4C454446  # MAGIC as a big-endian uint32, compared without a bytes object
+    RCVBUF_SIZE = 4 * 1024 * 1024  # Kernel receive buffer for frame bursts
+    HEADER_SIZE = _FRAME_HDR.size  # 4 bytes magic + 2 bytes width + 2 bytes height
+    MALFORMED_LOG_INTERVAL = 5.0  # Seconds between aggregate malformed-packet warnings
 
     def __init__(self, port: int, frame_queue: queue.Queue,
                  expected_width: int, expected_height: int):
@@ -50,9 +58,24 @@ class UDPFrameReceiver:
         self.running = False
         self.thread = None
         self.socket = None
+        self._selector = None
 
         self.frames_received = 0
         self.frames_dropped = 0
+        self.frames_malformed = 0
+
+        # Malformed packets are logged as one periodic summary, not per packet
+        self._malformed_logged = 0
+        self._last_malformed = None  # (format, args) of the latest rejection
+        self._next_malformed_log = 0.0
+
+        # Datagrams are scattered straight into the next frame array: header
+        # first, RGB payload into the frame, anything beyond into the spill
+        # buffer (max UDP payload) so oversized packets are still detected
+        self._hdr_buf = bytearray(self.HEADER_SIZE)
+        self._recv_buf = bytearray(65536)
+        self._recv_view = memoryview(self._recv_buf)
+        self._frame_buf, self._frame_view = self._new_frame_buffer()
 
     def start(self) -> None:
         """Start UDP receiver thread"""
@@ -64,7 +87,17 @@ class UDPFrameReceiver:
             # Create UDP socket
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.socket.bind(('0.0.0.0', self.port))
-            self.socket.settimeout(1.0)  # Allow periodic checks
+
+            # Room for bursts to queue in the kernel (capped by net.core.rmem_max)
+            try:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.RCVBUF_SIZE)
+            except OSError as e:
+                logger.debug(f"Could not enlarge UDP receive buffer: {e}")
+
+            # Non-blocking so the backlog can be drained; waits go through the selector
+            self.socket.setblocking(False)
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.socket, selectors.EVENT_READ)
 
             self.running = True
             self.thread = threading.Thread(target=self._run_loop, daemon=True)
@@ -87,6 +120,10 @@ class UDPFrameReceiver:
         if self.thread:
             self.thread.join(timeout=2.0)
 
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+
         if self.socket:
             self.socket.close()
             self.socket = None
@@ -99,11 +136,14 @@ class UDPFrameReceiver:
 
         while self.running:
             try:
-                # Receive data (blocks with timeout)
-                data, addr = self.socket.recvfrom(65536)
-
-                # Parse and validate frame
-                frame = self._parse_frame(data)
+                # Wait for data (timeout allows periodic checks)
+                if not self._selector.select(timeout=1.0):
+                    self._log_malformed()
+                    continue
+
+                # Newest valid frame from everything pending
+                frame = self._receive_latest()
+                self._log_malformed()
                 if frame is not None:
                     # Try to add to queue (non-blocking)
                     try:
@@ -113,61 +153,133 @@ class UDPFrameReceiver:
                         self.frames_dropped += 1
                         logger.warning("Frame queue full, dropping frame")
 
-            except socket.timeout:
-                # Normal timeout, continue
-                continue
             except Exception as e:
                 if self.running:  # Only log if not shutting down
                     logger.error(f"Error receiving UDP frame: {e}")
 
         logger.info("UDP receive loop ended")
 
-    def _parse_frame(self, data: bytes) -> Optional[np.ndarray]:
+    def _receive_latest(self) -> Optional[np.ndarray]:
         """
-        Parse UDP packet into frame
+        Drain all pending datagrams and keep the newest valid frame
+
+        Only the newest frame would be displayed anyway, so older valid
+        frames in the backlog are counted as dropped instead of queued.
+
+        Returns:
+            Newest valid frame, or None if no valid frame was pending
+        """
+        frame = None
+        while True:
+            try:
+                nbytes = self._recv_packet()
+            except (BlockingIOError, InterruptedError):
+                return frame
+
+            # Validate header; payload is already in self._frame_buf
+            if self._validate_packet(nbytes):
+                if frame is not None:
+                    self.frames_dropped += 1
+                    # Superseded frame was never queued, receive into it next
+                    next_buf = (frame, memoryview(frame).cast('B'))
+                else:
+                    next_buf = self._new_frame_buffer()
+                frame = self._frame_buf
+                self._frame_buf, self._frame_view = next_buf
+
+    def _new_frame_buffer(self) -> Tuple[np.ndarray, memoryview]:
+        """Allocate a frame array and a flat byte view for receiving into it"""
+        frame = np.empty((self.expected_height, self.expected_width, 3), dtype=np.uint8)
+        return frame, memoryview(frame).cast('B')
+
+    def _recv_packet(self) -> int:
+        """
+        Receive one datagram into the header buffer and current frame buffer
+
+        Returns:
+            Total datagram size in bytes
+
+        Raises:
+            BlockingIOError: If no datagram is pending
+        """
+        if hasattr(self.socket, 'recvmsg_into'):
+            nbytes, _, _, _ = self.socket.recvmsg_into(
+                [self._hdr_buf, self._frame_view, self._recv_buf])
+            return nbytes
+
+        # No scatter receive on this platform: receive whole packet, then copy
+        nbytes, _ = self.socket.recvfrom_into(self._recv_buf)
+        self._hdr_buf[:] = self._recv_view[:self.HEADER_SIZE]
+        if nbytes == self.HEADER_SIZE + len(self._frame_view):
+            self._frame_view[:] = self._recv_view[self.HEADER_SIZE:nbytes]
+        return nbytes
+
+    def _validate_packet(self, nbytes: int) -> bool:
+        """
+        Validate a received UDP packet
 
         Args:
-            data: Raw UDP packet data
+            nbytes: Total packet size in bytes (header in self._hdr_buf)
 
         Returns:
-            Frame array or None if invalid
+            True if the packet holds a complete frame of the expected size
         """
         try:
             # Check minimum size
-            if len(data) < self.HEADER_SIZE:
-                logger.warning(f"Packet too small: {len(data)} bytes")
-                return None
+            if nbytes < self.HEADER_SIZE:
+                return self._reject("Packet too small: %d bytes", nbytes)
 
             # Parse header
-            magic = data[0:4]
-            if magic != self.MAGIC:
-                logger.warning(f"Invalid magic: {magic.hex()}")
-                return None
-
-            width, height = struct.unpack('>HH', data[4:8])
+            magic, width, height = _FRAME_HDR.unpack_from(self._hdr_buf, 0)
+            if magic != self._MAGIC_INT:
+                return self._reject("Invalid magic: %08x", magic)
 
             # Validate dimensions
             if width != self.expected_width or height != self.expected_height:
-                logger.warning(f"Invalid dimensions: {width}x{height}, "
-                             f"expected {self.expected_width}x{self.expected_height}")
-                return None
+                return self._reject("Invalid dimensions: %dx%d, expected %dx%d",
+                                    width, height, self.expected_width, self.expected_height)
 
             # Calculate expected data size
             expected_data_size = width * height * 3
-            if len(data) != self.HEADER_SIZE + expected_data_size:
-                logger.warning(f"Invalid data size: {len(data)-self.HEADER_SIZE} bytes, "
-                             f"expected {expected_data_size}")
-                return None
-
-            # Extract RGB data
-            rgb_data = data[self.HEADER_SIZE:]
-            frame = np.frombuffer(rgb_data, dtype=np.uint8).reshape((height, width, 3))
+            if nbytes != self.HEADER_SIZE + expected_data_size:
+                return self._reject("Invalid data size: %d bytes, expected %d",
+                                    nbytes - self.HEADER_SIZE, expected_data_size)
 
-            return frame
+            return True
 
         except Exception as e:
             logger.error(f"Error parsing frame: {e}")
-            return None
+            return False
+
+    def _reject(self, fmt: str, *args) -> bool:
+        """
+        Count a malformed packet; details are logged later by _log_malformed
+
+        Args:
+            fmt: %-style description of the problem
+            *args: Values for fmt (formatted only when logged)
+
+        Returns:
+            False, for use as the validation result
+        """
+        self.frames_malformed += 1
+        self._last_malformed = (fmt, args)
+        return False
+
+    def _log_malformed(self) -> None:
+        """Emit one summary warning for packets rejected since the last one"""
+        count = self.frames_malformed - self._malformed_logged
+        if count == 0:
+            return
+
+        now = time.monotonic()
+        if now < self._next_malformed_log:
+            return
+
+        fmt, args = self._last_malformed
+        logger.warning("Dropped %d malformed UDP packet(s), last: " + fmt, count, *args)
+        self._malformed_logged = self.frames_malformed
+        self._next_malformed_log = now + self.MALFORMED_LOG_INTERVAL
 
 
 class PipeFrameReceiver:
@@ -234,41 +346,77 @@ class PipeFrameReceiver:
 
         logger.info("Pipe frame receiver stopped")
 
+    def _new_frame_buffer(self) -> Tuple[np.ndarray, memoryview]:
+        """Allocate a frame array and a flat byte view for reading into it"""
+        frame = np.empty((self.expected_height, self.expected_width, 3), dtype=np.uint8)
+        return frame, memoryview(frame).cast('B')
+
     def _run_loop(self) -> None:
         """Main receive loop (runs in thread)"""
         logger.info("Pipe receive loop started")
 
-        while self.running:
-            try:
-                # Open pipe for reading (blocks until writer connects)
-                with open(self.pipe_path, 'rb') as pipe:
-                    while self.running:
-                        # Read frame data
-                        data = pipe.read(self.frame_size)
-
-                        if len(data) == 0:
-                            # Writer closed pipe
-                            break
-
-                        if len(data) == self.frame_size:
-                            # Parse frame
-                            frame = np.frombuffer(data, dtype=np.uint8).reshape(
-                                (self.expected_height, self.expected_width, 3)
-                            )
-
-                            # Try to add to queue
-                            try:
-                                self.frame_queue.put_nowait(frame)
-                                self.frames_received += 1
-                            except queue.Full:
-                                logger.warning("Frame queue full, dropping frame")
-                        else:
-                            logger.warning(f"Incomplete frame: {len(data)} bytes")
+        selector = selectors.DefaultSelector()
+        fd = None
+        frame, view = self._new_frame_buffer()
+        offset = 0
 
-            except Exception as e:
-                if self.running:  # Only log if not shutting down
-                    logger.error(f"Error receiving pipe frame: {e}")
-                time.sleep(0.1)
+        try:
+            while self.running:
+                try:
+                    if fd is None:
+                        # Open without waiting for a writer to connect
+                        fd = os.open(self.pipe_path, os.O_RDONLY | os.O_NONBLOCK)
+                        selector.register(fd, selectors.EVENT_READ)
+
+                    # Wait for data (timeout allows periodic checks of self.running)
+                    if not selector.select(timeout=0.5):
+                        continue
+
+                    # Read straight into the remainder of the frame array
+                    try:
+                        nbytes = os.readv(fd, [view[offset:]])
+                    except BlockingIOError:
+                        continue
+
+                    if nbytes == 0:
+                        # Writer closed pipe; reopen so select stops reporting EOF
+                        if offset:
+                            logger.warning(f"Incomplete frame: {offset} bytes")
+                            offset = 0
+                        selector.unregister(fd)
+                        os.close(fd)
+                        fd = None
+                        continue
+
+                    offset += nbytes
+                    if offset < self.frame_size:
+                        continue
+
+                    # Frame complete; hand it off and receive into a fresh one
+                    completed = frame
+                    frame, view = self._new_frame_buffer()
+                    offset = 0
+
+                    # Try to add to queue
+                    try:
+                        self.frame_queue.put_nowait(completed)
+                        self.frames_received += 1
+                    except queue.Full:
+                        logger.warning("Frame queue full, dropping frame")
+
+                except Exception as e:
+                    if self.running:  # Only log if not shutting down
+                        logger.error(f"Error receiving pipe frame: {e}")
+                    if fd is not None:
+                        selector.unregister(fd)
+                        os.close(fd)
+                        fd = None
+                    offset = 0
+                    time.sleep(0.1)  # Prevent tight error loop
+        finally:
+            if fd is not None:
+                os.close(fd)
+            selector.close()
 
         logger.info("Pipe receive loop ended")
 
@@ -308,14 +456,15 @@ def bytes_to_frame(data: bytes, width: int, height: int) -> np.ndarray:
     return np.frombuffer(data, dtype=np.uint8).reshape((height, width, 3))
 
 
-def frame_to_bytes(frame: np.ndarray) -> bytes:
+def frame_to_bytes(frame: np.ndarray) -> memoryview:
     """
-    Convert frame array to raw bytes
+    Expose frame array as raw bytes without copying
 
     Args:
         frame: Frame array of shape (height, width, 3)
 
     Returns:
-        Raw RGB bytes
+        Flat byte view of the RGB data (copied only if frame isn't contiguous
+        uint8); accepted by socket.send, file writes and bytes()
     """
-    return frame.tobytes()
+    return memoryview(np.ascontiguousarray(frame, dtype=np.uint8)).cast('B')
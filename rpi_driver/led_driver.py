@@ -4,9 +4,10 @@ LED Driver for WS2812B panels via Raspberry Pi GPIO
 Wraps rpi-ws281x library with clean interface
 """
 
+import ctypes
 import logging
 import numpy as np
-from typing import Tuple
+from typing import Optional
 
 try:
     from rpi_ws281x import PixelStrip, Color, ws
@@ -113,6 +114,34 @@ class LEDDriver:
             logger.error("Make sure you're running with sudo or have GPIO permissions")
             raise
 
+        # Direct view of the library's LED color array (allocated by begin())
+        self._led_buf = self._map_led_buffer()
+
+        # Scratch for packing frames into _led_buf without per-frame allocation
+        self._pack_tmp = np.empty(led_count, dtype=np.uint32) if self._led_buf is not None else None
+
+    def _map_led_buffer(self) -> Optional[np.ndarray]:
+        """
+        Map the channel's C LED array (ws2811_led_t, 0x00RRGGBB) as numpy
+
+        Returns:
+            uint32 array of length led_count sharing memory with the strip,
+            or None if unavailable (per-pixel setPixelColor is used instead)
+        """
+        if not RPI_WS281X_AVAILABLE:
+            return None
+
+        try:
+            leds = ws.ws2811_channel_t_leds_get(self.strip._channel)
+            address = int(leds)  # SWIG pointer -> raw address
+            if not address:
+                return None
+            c_array = (ctypes.c_uint32 * self.led_count).from_address(address)
+            return np.ctypeslib.as_array(c_array)
+        except Exception as e:
+            logger.debug(f"LED buffer not directly accessible, using per-pixel writes: {e}")
+            return None
+
     def set_pixel(self, index: int, r: int, g: int, b: int) -> None:
         """
         Set color for a single LED
@@ -141,14 +170,33 @@ class LEDDriver:
             logger.error(f"Invalid frame shape: {rgb_array.shape}, expected ({self.led_count}, 3)")
             return
 
-        # Store current frame for power calculations
-        self.current_frame = rgb_array.copy()
+        rgb_array = rgb_array.astype(np.uint8, copy=False)
 
-        # Set all pixels from array
-        for i in range(self.led_count):
+        if self._led_buf is not None:
+            # Store current frame for power calculations (in place, no reallocation)
+            np.copyto(self.current_frame, rgb_array)
+
+            # Pack to Color() layout (0x00RRGGBB) directly in the strip buffer;
+            # the library only reads it during show()
+            frame = self.current_frame
+            led_buf, tmp = self._led_buf, self._pack_tmp
+            np.left_shift(frame[:, 0], 16, out=led_buf, dtype=np.uint32)
+            np.left_shift(frame[:, 1], 8, out=tmp, dtype=np.uint32)
+            np.bitwise_or(led_buf, tmp, out=led_buf)
+            np.bitwise_or(led_buf, frame[:, 2], out=led_buf, dtype=np.uint32)
+            return
+
+        # current_frame mirrors the strip buffer, so only changed LEDs need writing
+        changed = np.flatnonzero(np.any(rgb_array != self.current_frame, axis=1))
+
+        # Store current frame for power calculations (in place, no reallocation)
+        np.copyto(self.current_frame, rgb_array)
+
+        # Set changed pixels from array
+        for i in changed:
             r, g, b = rgb_array[i]
             color = Color(int(r), int(g), int(b))
-            self.strip.setPixelColor(i, color)
+            self.strip.setPixelColor(int(i), color)
 
     def show(self) -> None:
         """
@@ -160,6 +208,10 @@ class LEDDriver:
     def clear(self) -> None:
         """Clear all LEDs (set to black)"""
         self.current_frame.fill(0)
+        if self._led_buf is not None:
+            self._led_buf.fill(0)
+            return
+
         for i in range(self.led_count):
             self.strip.setPixelColor(i, Color(0, 0, 0))
 
@@ -190,7 +242,17 @@ class LEDDriver:
             g: Green value (0-255)
             b: Blue value (0-255)
         """
-        self.current_frame[:] = [r, g, b]
+        if r == g == b:
+            # Grayscale: one contiguous memset instead of a per-channel broadcast
+            self.current_frame.fill(r)
+        else:
+            self.current_frame[:] = [r, g, b]
+
+        if self._led_buf is not None:
+            # One packed value broadcast over the strip buffer
+            self._led_buf.fill((r << 16) | (g << 8) | b)
+            return
+
         color = Color(r, g, b)
         for i in range(self.led_count):
             self.strip.setPixelColor(i, color)
@@ -227,12 +289,15 @@ class MockLEDDriver(LEDDriver):
     def set_frame(self, rgb_array: np.ndarray) -> None:
         """Set frame in mock buffer"""
         if rgb_array.shape == (self.led_count, 3):
-            self.buffer = rgb_array.copy()
+            # Copy into the existing buffer so current_frame stays aliased
+            np.copyto(self.buffer, rgb_array, casting='unsafe')
 
     def show(self) -> None:
         """Mock show - just log"""
-        non_black = np.sum(np.any(self.buffer > 0, axis=1))
-        logger.debug(f"Mock show: {non_black}/{self.led_count} LEDs lit")
+        # Counting lit LEDs scans the buffer; skip it unless the message is emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            non_black = int(np.count_nonzero(self.buffer.any(axis=1)))
+            logger.debug(f"Mock show: {non_black}/{self.led_count} LEDs lit")
 
     def clear(self) -> None:
         """Clear mock buffer"""
@@ -246,4 +311,7 @@ class MockLEDDriver(LEDDriver):
 
     def fill(self, r: int, g: int, b: int) -> None:
         """Fill mock buffer"""
-        self.buffer[:] = [r, g, b]
+        if r == g == b:
+            self.buffer.fill(r)
+        else:
+            self.buffer[:] = [r, g, b]
@@ -10,7 +10,6 @@ import signal
 import sys
 import queue
 import threading
-from pathlib import Path
 
 import uvicorn
 
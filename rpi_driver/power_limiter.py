@@ -56,6 +56,9 @@ class PowerLimiter:
         self.limit_applied_count = 0
         self.last_limited_brightness = None
 
+        # Full-brightness current of the last frame, reused for repeated frames
+        self._last_current_at_full = None
+
         logger.info(f"Power limiter initialized: {max_current_amps}A limit for {led_count} LEDs")
         logger.info(f"Max theoretical draw: {(led_count * self.LED_CURRENT_FULL_WHITE / 1000.0):.2f}A")
         logger.info(f"Power limiting: {'ENABLED' if enabled else 'DISABLED'}")
@@ -74,36 +77,39 @@ class PowerLimiter:
         Returns:
             Expected current in Amps
         """
-        if frame is None or frame.size == 0:
-            return 0.0
-
-        # Calculate brightness factor (0.0 to 1.0)
-        brightness_factor = brightness / 255.0
+        return self._current_at_full(frame) * brightness / 255.0
 
-        # Sum all RGB values across all LEDs
-        total_rgb_sum = np.sum(frame)
+    def _current_at_full(self, frame: Optional[np.ndarray]) -> float:
+        """
+        Expected current draw for a frame at full brightness (one pass over the frame)
 
-        # Maximum possible sum if all pixels were full white
-        max_possible_sum = self.led_count * 3 * 255
+        Current scales linearly with brightness, so callers derive other
+        brightness levels as current_at_full * brightness / 255.
 
-        # Calculate intensity factor (what fraction of max we're using)
-        intensity_factor = total_rgb_sum / max_possible_sum if max_possible_sum > 0 else 0
+        Args:
+            frame: RGB frame array (led_count, 3)
 
-        # Current per LED at this intensity and brightness
-        current_per_led_ma = self.LED_CURRENT_FULL_WHITE * intensity_factor * brightness_factor
+        Returns:
+            Expected current in Amps at brightness 255
+        """
+        if frame is None or frame.size == 0 or self.led_count <= 0:
+            return 0.0
 
-        # Total current in milliamps, then convert to Amps
-        total_current_ma = current_per_led_ma * self.led_count
-        total_current_a = total_current_ma / 1000.0
+        # Sum all RGB values across all LEDs
+        total_rgb_sum = int(frame.sum(dtype=np.uint64))
 
-        return total_current_a
+        # Each LED draws LED_CURRENT_FULL_WHITE at (255, 255, 255), so the
+        # led_count in intensity (sum / (led_count * 765)) and in the total cancels
+        return self.LED_CURRENT_FULL_WHITE * total_rgb_sum / (3 * 255 * 1000.0)
 
-    def calculate_max_safe_brightness(self, frame: np.ndarray) -> int:
+    def calculate_max_safe_brightness(self, frame: np.ndarray,
+                                      current_at_full: Optional[float] = None) -> int:
         """
         Calculate maximum safe brightness for a frame within power limit
 
         Args:
             frame: RGB frame array (led_count, 3)
+            current_at_full: Frame's current at full brightness, if already known
 
         Returns:
             Maximum safe brightness (0-255)
@@ -112,7 +118,8 @@ class PowerLimiter:
             return 255
 
         # Calculate current at full brightness for this frame
-        current_at_full = self.calculate_frame_current(frame, 255)
+        if current_at_full is None:
+            current_at_full = self._current_at_full(frame)
 
         if current_at_full <= 0:
             return 255
@@ -128,7 +135,8 @@ class PowerLimiter:
 
     def limit_brightness_for_frame(self,
                                    frame: np.ndarray,
-                                   requested_brightness: int) -> Tuple[int, bool]:
+                                   requested_brightness: int,
+                                   frame_unchanged: bool = False) -> Tuple[int, bool]:
         """
         Calculate safe brightness level for a frame to stay within current limit
 
@@ -138,6 +146,8 @@ class PowerLimiter:
         Args:
             frame: RGB frame array (led_count, 3)
             requested_brightness: Requested brightness level (0-255)
+            frame_unchanged: True if frame has the same content as the previous
+                call, so its current is reused instead of re-summing the frame
 
         Returns:
             Tuple of (safe_brightness, was_limited/optimized)
@@ -148,13 +158,21 @@ class PowerLimiter:
         if frame is None or frame.size == 0:
             return requested_brightness, False
 
+        # Sum the frame once; current at any brightness scales from this.
+        # Only the sum is reused for repeats: limits and dynamic mode still apply.
+        if frame_unchanged and self._last_current_at_full is not None:
+            current_at_full = self._last_current_at_full
+        else:
+            current_at_full = self._current_at_full(frame)
+            self._last_current_at_full = current_at_full
+
         # Calculate maximum safe brightness for this frame
-        max_safe = self.calculate_max_safe_brightness(frame)
+        max_safe = self.calculate_max_safe_brightness(frame, current_at_full)
 
         if self.dynamic_mode:
             # Dynamic mode: maintain target current by adjusting brightness
             # Calculate current at current target brightness
-            current_at_target = self.calculate_frame_current(frame, self.target_brightness)
+            current_at_target = current_at_full * self.target_brightness / 255.0
 
             # Compare to target current (max_current_amps is the target to maintain)
             current_error = self.max_current_amps - current_at_target
@@ -192,7 +210,7 @@ class PowerLimiter:
             was_modified = (output_brightness != requested_brightness)
 
             if was_modified and self.optimization_count % 100 == 1:
-                actual_current = self.calculate_frame_current(frame, output_brightness)
+                actual_current = current_at_full * output_brightness / 255.0
                 logger.info(f"Dynamic brightness: {requested_brightness} → {output_brightness} "
                           f"(current: {actual_current:.2f}A, target: {self.max_current_amps}A)")
 
@@ -201,7 +219,7 @@ class PowerLimiter:
         else:
             # Standard mode: only limit when exceeding power
             # Calculate current at requested brightness
-            current_at_requested = self.calculate_frame_current(frame, requested_brightness)
+            current_at_requested = current_at_full * requested_brightness / 255.0
 
             # If we're under the limit, no adjustment needed
             if current_at_requested <= self.max_current_amps:
@@ -10,14 +10,68 @@ import numpy as np
 import time
 import math
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _render_metaballs(xs, ys, blob_x, blob_y, radii, row_color, frame):
+        """
+        Fused per-pixel metaball field, threshold and color (no temporaries)
+
+        Args:
+            xs: Pixel x coordinates, shape (width,)
+            ys: Pixel y coordinates, shape (height,)
+            blob_x: Blob center x coordinates, shape (n_blobs,)
+            blob_y: Blob center y coordinates, shape (n_blobs,)
+            radii: Temperature-scaled blob radii, shape (n_blobs,)
+            row_color: Blob RGB for each row's temperature, shape (height, 3)
+            frame: Output RGB frame, shape (height, width, 3), written in place
+        """
+        height = ys.shape[0]
+        width = xs.shape[0]
+        for i in prange(height):
+            y = ys[i]
+            base_r = row_color[i, 0]
+            base_g = row_color[i, 1]
+            base_b = row_color[i, 2]
+
+            for j in range(width):
+                x = xs[j]
+                field = np.float32(0.0)
+                for k in range(blob_x.shape[0]):
+                    dx = x - blob_x[k]
+                    dy = y - blob_y[k]
+                    field += np.float32(radii[k] / (math.sqrt(dx * dx + dy * dy) + 0.001))
+
+                if field > 1.0:
+                    intensity = min(field / np.float32(2.0), np.float32(1.0))
+                    frame[i, j, 0] = np.uint8(base_r * intensity)
+                    frame[i, j, 1] = np.uint8(base_g * intensity)
+                    frame[i, j, 2] = np.uint8(base_b * intensity)
+                else:
+                    # Background color - dark purple
+                    frame[i, j, 0] = 10
+                    frame[i, j, 1] = 0
+                    frame[i, j, 2] = 20
+
 
 class SimpleLavaLamp:
     """Simple lava lamp with sin/cos animated metaballs"""
 
+    # Blob RGB per temperature band: hot (bottom), warm, cool (top)
+    _COLOR_LUT = np.array([[255, 200, 50],
+                           [255, 150, 30],
+                           [220, 50, 20]], dtype=np.float64)
+
     def __init__(self, width: int = 32, height: int = 32):
         self.width = width
         self.height = height
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
 
         # 10 blobs with different animation parameters (3x larger, 2x speed)
         self.blobs = [
@@ -33,6 +87,35 @@ class SimpleLavaLamp:
             {'x_speed': 0.018, 'x_range': 0.1, 'y_speed': 0.20, 'y_range': 0.5, 'radius': 0.045},
         ]
 
+        # Blob parameters as arrays (structure of arrays) for vectorized updates
+        self._x_speed = np.array([b['x_speed'] for b in self.blobs])
+        self._x_range = np.array([b['x_range'] for b in self.blobs])
+        self._y_speed = np.array([b['y_speed'] for b in self.blobs])
+        self._y_range = np.array([b['y_range'] for b in self.blobs])
+        self._radius = np.array([b['radius'] for b in self.blobs])
+
+        # Pixel coordinates, as broadcastable row (1, W) and column (H, 1) grids
+        self._xs = np.linspace(-0.5, 0.5, width)
+        self._ys = np.linspace(-0.5, 0.5, height)
+        self._xx = self._xs[np.newaxis, :]
+        self._yy = self._ys[:, np.newaxis]
+
+        # Blob color of each row, from its temperature band (0 = hot, 1 = warm,
+        # 2 = cool); temperature runs 1 at the top to 0 at the bottom, so hot
+        # is at the bottom. Constant per row, so computed once.
+        temp = np.linspace(1, 0, height)
+        temp_band = (temp >= 0.3).astype(np.intp) + (temp >= 0.6)
+        self._base_color = self._COLOR_LUT[temp_band]
+
+        # Scratch buffers reused every frame by the NumPy renderer. The output
+        # frame itself is not reused: it is handed to another thread via a queue.
+        self._field = np.empty((height, width), dtype=np.float32)
+        self._dist = np.empty((height, width))
+        self._dx2 = np.empty((1, width))
+        self._dy2 = np.empty((height, 1))
+        self._mask = np.empty((height, width), dtype=bool)
+        self._rgb = np.empty((height, width, 3))
+
     def scale_by_temp(self, y_norm: float) -> float:
         """Scale blob size by temperature (height) - hotter = bigger"""
         return 1.0 / math.log(y_norm + 2.0) - 0.6
@@ -46,58 +129,80 @@ class SimpleLavaLamp:
 
         return (x, y)
 
+    def _blob_state(self, t: float) -> tuple:
+        """
+        Positions and temperature-scaled radii of all blobs at time t
+
+        Args:
+            t: Animation time in seconds
+
+        Returns:
+            Tuple of (blob_x, blob_y, radii) arrays, one entry per blob
+        """
+        blob_x = np.sin(t * self._x_speed) * self._x_range
+        blob_y = np.cos(t * self._y_speed) * self._y_range
+
+        # Temperature scaling based on Y position (reduced scaling), as scale_by_temp
+        temp_scale = 1.0 / np.log(blob_y + 2.5) - 0.6
+        radii = self._radius * np.maximum(0.8, temp_scale * 0.8)
+
+        return blob_x, blob_y, radii
+
     def render_frame(self) -> np.ndarray:
-        """Render current frame using vectorized NumPy operations"""
+        """Render current frame (compiled kernel if numba is available, else NumPy)"""
         # Current time
-        t = time.time() - self.start_time
+        t = time.monotonic() - self.start_time
 
-        # Create coordinate grids (vectorized)
-        x = np.linspace(-0.5, 0.5, self.width)
-        y = np.linspace(-0.5, 0.5, self.height)
-        xx, yy = np.meshgrid(x, y)
+        if NUMBA_AVAILABLE:
+            return self._render_frame_numba(t)
 
         # Initialize metaball field
-        field = np.zeros((self.height, self.width), dtype=np.float32)
+        field = self._field
+        field.fill(0)
+        dist = self._dist
 
         # Add contribution from all blobs
-        for i in range(len(self.blobs)):
-            blob_x, blob_y = self.get_blob_position(i, t)
-
-            # Temperature scaling based on Y position (reduced scaling)
-            temp_scale = self.scale_by_temp(blob_y + 0.5)
-            radius = self.blobs[i]['radius'] * max(0.8, temp_scale * 0.8)
-
-            # Distance from each pixel to blob center (vectorized)
-            dx = xx - blob_x
-            dy = yy - blob_y
-            dist = np.sqrt(dx * dx + dy * dy) + 0.001  # Add small value to avoid division by zero
+        for blob_x, blob_y, radius in zip(*self._blob_state(t)):
+            # Distance from each pixel to blob center (row/column broadcast, in place)
+            dx2 = np.subtract(self._xx, blob_x, out=self._dx2)
+            dx2 *= dx2
+            dy2 = np.subtract(self._yy, blob_y, out=self._dy2)
+            dy2 *= dy2
+            np.add(dx2, dy2, out=dist)
+            np.sqrt(dist, out=dist)
+            dist += 0.001  # Add small value to avoid division by zero
 
             # Metaball contribution: radius / distance
-            field += radius / dist
+            np.divide(radius, dist, out=dist)
+            field += dist
 
         # Create frame
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
 
         # Background color - dark purple
         frame[:, :] = [10, 0, 20]
 
         # Apply threshold and color (balanced threshold)
-        mask = field > 1.0
-        if np.any(mask):
-            # Normalize field for color intensity
-            intensity = np.clip(field / 2.0, 0, 1)
+        mask = np.greater(field, 1.0, out=self._mask)
+        if mask.any():
+            # Normalize field for color intensity, in place: the field is no
+            # longer needed and is always positive, so only the top clip applies
+            intensity = np.multiply(field, 0.5, out=field)
+            np.minimum(intensity, 1.0, out=intensity)
+
+            # Color per row from its temperature band, scaled by intensity
+            rgb = np.multiply(self._base_color[:, np.newaxis, :], intensity[:, :, np.newaxis],
+                              out=self._rgb)
 
-            # Temperature based on Y position (0 = bottom/hot, 1 = top/cool)
-            temp = np.linspace(1, 0, self.height)[:, np.newaxis]  # Flipped so hot is at bottom
+            # Apply colors where field exceeds threshold (masked blend, no index arrays)
+            np.copyto(frame, rgb, casting='unsafe', where=mask[:, :, np.newaxis])
 
-            # Color channels based on temperature and intensity
-            r = np.where(temp < 0.3, 255, np.where(temp < 0.6, 255, 220)) * intensity
-            g = np.where(temp < 0.3, 200, np.where(temp < 0.6, 150, 50)) * intensity
-            b = np.where(temp < 0.3, 50, np.where(temp < 0.6, 30, 20)) * intensity
+        return frame
 
-            # Apply colors where field exceeds threshold
-            frame[mask, 0] = r[mask].astype(np.uint8)
-            frame[mask, 1] = g[mask].astype(np.uint8)
-            frame[mask, 2] = b[mask].astype(np.uint8)
+    def _render_frame_numba(self, t: float) -> np.ndarray:
+        """Render frame at time t with the fused numba kernel"""
+        blob_x, blob_y, radii = self._blob_state(t)
 
+        frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        _render_metaballs(self._xs, self._ys, blob_x, blob_y, radii, self._base_color, frame)
         return frame
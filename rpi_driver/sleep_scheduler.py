@@ -6,8 +6,7 @@ Automatically turns display on/off at scheduled times
 
 import logging
 import threading
-import time
-from datetime import datetime, time as dt_time
+from datetime import datetime, timedelta, time as dt_time
 from typing import Optional, Callable
 
 logger = logging.getLogger(__name__)
@@ -19,6 +18,8 @@ class SleepScheduler:
     Turns display off and on at specified times
     """
 
+    MAX_WAIT = 300.0  # Re-check at least this often (seconds), in case the wall clock jumps
+
     def __init__(self, set_brightness_callback: Callable[[int], None], get_brightness_callback: Callable[[], int]):
         """
         Initialize sleep scheduler
@@ -37,6 +38,9 @@ class SleepScheduler:
         self.saved_brightness = 128  # Brightness to restore when waking
         self.is_sleeping = False
 
+        # Set to wake the scheduler thread early (schedule change or stop)
+        self._wakeup = threading.Event()
+
         logger.info("Sleep scheduler initialized")
 
     def set_schedule(self, off_time_str: str, on_time_str: str, enabled: bool = True) -> None:
@@ -60,9 +64,12 @@ class SleepScheduler:
             logger.info(f"Sleep schedule set: Off at {off_time_str}, On at {on_time_str}, "
                        f"Enabled: {enabled}")
 
+            # Re-evaluate now rather than at the previously computed deadline
+            self._wakeup.set()
+
         except Exception as e:
             logger.error(f"Error setting sleep schedule: {e}")
-            raise ValueError(f"Invalid time format. Use HH:MM (24-hour)")
+            raise ValueError("Invalid time format. Use HH:MM (24-hour)")
 
     def get_schedule(self) -> dict:
         """Get current schedule"""
@@ -85,6 +92,7 @@ class SleepScheduler:
         """Stop the scheduler thread"""
         if self.running:
             self.running = False
+            self._wakeup.set()
             if self.thread:
                 self.thread.join(timeout=2.0)
             logger.info("Sleep scheduler stopped")
@@ -93,8 +101,12 @@ class SleepScheduler:
         """Main scheduler loop (runs in background thread)"""
         while self.running:
             try:
+                self._wakeup.clear()
+                timeout = None  # No schedule: wait for set_schedule() or stop()
+
                 if self.enabled and self.off_time and self.on_time:
-                    current_time = datetime.now().time()
+                    now = datetime.now()
+                    current_time = now.time()
 
                     # Check if it's time to sleep
                     if self._should_sleep(current_time):
@@ -113,12 +125,32 @@ class SleepScheduler:
                             self.set_brightness(self.saved_brightness)
                             self.is_sleeping = False
 
-                # Check every 30 seconds
-                time.sleep(30)
+                    timeout = min(self._seconds_until_next_change(now), self.MAX_WAIT)
+
+                # Block until the next on/off time instead of polling
+                self._wakeup.wait(timeout)
 
             except Exception as e:
                 logger.error(f"Error in scheduler loop: {e}")
-                time.sleep(60)
+                self._wakeup.wait(60)
+
+    def _seconds_until_next_change(self, now: datetime) -> float:
+        """
+        Seconds until the next scheduled off or on time
+
+        Args:
+            now: Current local date and time
+
+        Returns:
+            Seconds until the nearest upcoming off_time/on_time
+        """
+        waits = []
+        for change_time in (self.off_time, self.on_time):
+            change = datetime.combine(now.date(), change_time)
+            if change <= now:
+                change += timedelta(days=1)
+            waits.append((change - now).total_seconds())
+        return min(waits)
 
     def _should_sleep(self, current_time: dt_time) -> bool:
         """Check if display should be sleeping"""
@@ -7,9 +7,9 @@ Built-in patterns for alignment testing and visual effects
 import numpy as np
 import math
 import colorsys
-from datetime import datetime, timedelta
+import functools
+from datetime import datetime
 from typing import Tuple
-from PIL import Image, ImageDraw, ImageFont
 
 
 # Perlin Noise Implementation
@@ -75,6 +75,21 @@ class PerlinNoise:
 _perlin = PerlinNoise(seed=42)
 
 
+def _static_pattern(func):
+    """
+    Render a pattern that doesn't animate once per set of arguments
+
+    The cached frame is marked read-only so callers can't corrupt it.
+    """
+    @functools.lru_cache(maxsize=16)
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        frame = func(*args, **kwargs)
+        frame.setflags(write=False)
+        return frame
+    return wrapper
+
+
 def solid_color(width: int, height: int, r: int, g: int, b: int) -> np.ndarray:
     """
     Create solid color frame
@@ -85,13 +100,13 @@ def solid_color(width: int, height: int, r: int, g: int, b: int) -> np.ndarray:
         r, g, b: RGB color values (0-255)
 
     Returns:
-        Frame array of shape (height, width, 3)
+        Read-only frame array of shape (height, width, 3)
     """
-    frame = np.zeros((height, width, 3), dtype=np.uint8)
-    frame[:, :] = [r, g, b]
-    return frame
+    # Broadcast a single pixel instead of materialising height*width*3 bytes
+    return np.broadcast_to(np.array([r, g, b], dtype=np.uint8), (height, width, 3))
 
 
+@_static_pattern
 def corner_markers(width: int, height: int, size: int = 3) -> np.ndarray:
     """
     Create frame with colored markers in each corner
@@ -129,6 +144,7 @@ def corner_markers(width: int, height: int, size: int = 3) -> np.ndarray:
     return frame
 
 
+@_static_pattern
 def cross_hair(width: int, height: int, color: Tuple[int, int, int] = (255, 255, 255)) -> np.ndarray:
     """
     Create frame with crosshair in center
@@ -154,6 +170,7 @@ def cross_hair(width: int, height: int, color: Tuple[int, int, int] = (255, 255,
     return frame
 
 
+@_static_pattern
 def checkerboard(width: int, height: int, cell_size: int = 4,
                  color1: Tuple[int, int, int] = (255, 255, 255),
                  color2: Tuple[int, int, int] = (0, 0, 0)) -> np.ndarray:
@@ -170,18 +187,48 @@ def checkerboard(width: int, height: int, cell_size: int = 4,
     Returns:
         Frame array with checkerboard pattern
     """
-    frame = np.zeros((height, width, 3), dtype=np.uint8)
-
-    for y in range(height):
-        for x in range(width):
-            if (x // cell_size + y // cell_size) % 2 == 0:
-                frame[y, x] = color1
-            else:
-                frame[y, x] = color2
+    # Write each pixel once with its final color instead of clearing first
+    ys, xs = np.ogrid[:height, :width]
+    even = ((xs // cell_size + ys // cell_size) % 2 == 0)[..., np.newaxis]
+    frame = np.where(even, np.array(color1, dtype=np.uint8),
+                     np.array(color2, dtype=np.uint8))
 
     return frame
 
 
+def _hsv_to_rgb_array(hue: np.ndarray, saturation: float = 1.0, value: float = 1.0) -> np.ndarray:
+    """
+    Vectorized colorsys.hsv_to_rgb for an array of hues, scaled to uint8
+
+    Uses the same arithmetic as colorsys, so each pixel matches
+    int(channel * 255) of the per-pixel version exactly.
+
+    Args:
+        hue: Hue array (0.0-1.0)
+        saturation: Saturation (0.0-1.0)
+        value: Value/brightness (0.0-1.0)
+
+    Returns:
+        uint8 array of shape hue.shape + (3,)
+    """
+    h6 = hue * 6.0
+    sector = np.floor(h6)
+    f = h6 - sector
+    p = np.full_like(hue, value * (1.0 - saturation))
+    q = value * (1.0 - saturation * f)
+    t = value * (1.0 - saturation * (1.0 - f))
+    v = np.full_like(hue, value)
+
+    sector = sector.astype(np.intp) % 6
+    rgb = np.empty(hue.shape + (3,))
+    for channel, choices in enumerate(((v, q, p, p, t, v),
+                                       (t, v, v, q, p, p),
+                                       (p, p, t, v, v, q))):
+        rgb[..., channel] = np.choose(sector, choices)
+
+    return (rgb * 255).astype(np.uint8)
+
+
 def rainbow_gradient(width: int, height: int, orientation: str = "horizontal",
                     offset: float = 0) -> np.ndarray:
     """
@@ -196,22 +243,20 @@ def rainbow_gradient(width: int, height: int, orientation: str = "horizontal",
     Returns:
         Frame array with rainbow gradient
     """
-    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    y, x = np.ogrid[:height, :width]
 
-    for y in range(height):
-        for x in range(width):
-            if orientation == "horizontal":
-                hue = (x / width + offset) % 1.0
-            elif orientation == "vertical":
-                hue = (y / height + offset) % 1.0
-            elif orientation == "diagonal":
-                hue = ((x + y) / (width + height) + offset) % 1.0
-            else:
-                hue = 0.0
-
-            r, g, b = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-            frame[y, x] = [int(r * 255), int(g * 255), int(b * 255)]
+    if orientation == "horizontal":
+        hue = (x / width + offset) % 1.0
+    elif orientation == "vertical":
+        hue = (y / height + offset) % 1.0
+    elif orientation == "diagonal":
+        hue = ((x + y) / (width + height) + offset) % 1.0
+    else:
+        hue = np.zeros(1)
 
+    # Horizontal/vertical hue varies along one axis only: convert once and broadcast
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    frame[...] = _hsv_to_rgb_array(hue)
     return frame
 
 
@@ -227,21 +272,15 @@ def spiral_rainbow(width: int, height: int, offset: float = 0) -> np.ndarray:
     Returns:
         Frame array with spiral pattern
     """
-    frame = np.zeros((height, width, 3), dtype=np.uint8)
-
     center_x, center_y = width / 2, height / 2
 
-    for y in range(height):
-        for x in range(width):
-            dx, dy = x - center_x, y - center_y
-            angle = math.atan2(dy, dx)
-            distance = math.sqrt(dx*dx + dy*dy)
+    y, x = np.ogrid[:height, :width]
+    dx, dy = x - center_x, y - center_y
+    angle = np.arctan2(dy, dx)
+    distance = np.sqrt(dx*dx + dy*dy)
 
-            hue = (angle / (2 * math.pi) + distance * 0.05 + offset) % 1.0
-            r, g, b = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-            frame[y, x] = [int(r * 255), int(g * 255), int(b * 255)]
-
-    return frame
+    hue = (angle / (2 * math.pi) + distance * 0.05 + offset) % 1.0
+    return _hsv_to_rgb_array(hue)
 
 
 def wave_pattern(width: int, height: int, offset: float = 0) -> np.ndarray:
@@ -339,6 +378,7 @@ def moving_dot(width: int, height: int, offset: float = 0,
     return frame
 
 
+@_static_pattern
 def grid_lines(width: int, height: int, grid_size: int = 16,
               color: Tuple[int, int, int] = (64, 64, 64)) -> np.ndarray:
     """
@@ -366,6 +406,7 @@ def grid_lines(width: int, height: int, grid_size: int = 16,
     return frame
 
 
+@_static_pattern
 def panel_numbers(width: int, height: int, panel_width: int = 16,
                  panel_height: int = 16) -> np.ndarray:
     """
@@ -407,6 +448,38 @@ def panel_numbers(width: int, height: int, panel_width: int = 16,
     return frame
 
 
+# Font for elapsed_time, loaded on first use instead of every frame
+_elapsed_time_font = None
+
+# Fixed text colors for elapsed_time's color_mode; any other mode cycles a rainbow
+_ELAPSED_TIME_COLORS = {
+    'cyan': (0, 255, 255),
+    'magenta': (255, 0, 255),
+    'white': (255, 255, 255),
+    'red': (255, 0, 0),
+    'green': (0, 255, 0),
+    'blue': (0, 0, 255),
+    'yellow': (255, 255, 0),
+    'purple': (128, 0, 255),
+    'orange': (255, 165, 0),
+}
+
+
+def _get_elapsed_time_font():
+    """Load (once) the largest available font for elapsed_time"""
+    global _elapsed_time_font
+    if _elapsed_time_font is None:
+        from PIL import ImageFont
+        try:
+            # Try to load a larger TrueType font
+            font_size = 14  # Large font for readability
+            _elapsed_time_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf", font_size)
+        except:
+            # Fallback to default
+            _elapsed_time_font = ImageFont.load_default()
+    return _elapsed_time_font
+
+
 def elapsed_time(width: int, height: int, offset: float = 0) -> np.ndarray:
     """
     Display elapsed time since a specific date
@@ -422,6 +495,9 @@ def elapsed_time(width: int, height: int, offset: float = 0) -> np.ndarray:
     Returns:
         Frame array with elapsed time text
     """
+    # PIL is only needed here, so keep it out of module import time
+    from PIL import Image, ImageDraw
+
     # Create blank frame
     frame = np.zeros((height, width, 3), dtype=np.uint8)
 
@@ -442,15 +518,8 @@ def elapsed_time(width: int, height: int, offset: float = 0) -> np.ndarray:
     color = (int(r * 255), int(g * 255), int(b * 255))
 
     # For 32x32, split into 3 lines
-    # Try to use the largest possible font
-    try:
-        # Try to load a larger TrueType font
-        font_size = 14  # Large font for readability
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf", font_size)
-    except:
-        # Fallback to default
-        font = ImageFont.load_default()
-        font_size = 10
+    # Use the largest possible font (cached after the first frame)
+    font = _get_elapsed_time_font()
 
     # Create image at display resolution
     img = Image.new('RGB', (width, height), color=(0, 0, 0))
@@ -474,31 +543,9 @@ def elapsed_time(width: int, height: int, offset: float = 0) -> np.ndarray:
     # Get color based on global setting (controlled via web UI)
     color_mode = getattr(elapsed_time, 'color_mode', 'rainbow')
 
-    if color_mode == 'rainbow':
-        # Rainbow cycle
-        hue = (offset * 0.1) % 1.0
-        r, g, b = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-        color = (int(r * 255), int(g * 255), int(b * 255))
-    elif color_mode == 'cyan':
-        color = (0, 255, 255)
-    elif color_mode == 'magenta':
-        color = (255, 0, 255)
-    elif color_mode == 'white':
-        color = (255, 255, 255)
-    elif color_mode == 'red':
-        color = (255, 0, 0)
-    elif color_mode == 'green':
-        color = (0, 255, 0)
-    elif color_mode == 'blue':
-        color = (0, 0, 255)
-    elif color_mode == 'yellow':
-        color = (255, 255, 0)
-    elif color_mode == 'purple':
-        color = (128, 0, 255)
-    elif color_mode == 'orange':
-        color = (255, 165, 0)
-    else:
-        # Default to rainbow
+    color = _ELAPSED_TIME_COLORS.get(color_mode)
+    if color is None:
+        # Rainbow cycle ('rainbow' and the default for unknown modes)
         hue = (offset * 0.1) % 1.0
         r, g, b = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
         color = (int(r * 255), int(g * 255), int(b * 255))
@@ -1397,10 +1444,8 @@ def geometric_patterns(width: int, height: int, offset: float = 0) -> np.ndarray
     Returns:
         Frame array with geometric patterns
     """
-    frame = np.zeros((height, width, 3), dtype=np.uint8)
-
     # Dark background
-    frame[:, :] = [10, 10, 15]
+    frame = np.full((height, width, 3), [10, 10, 15], dtype=np.uint8)
 
     # Center point
     cx = width / 2.0
@@ -1620,10 +1665,8 @@ def matrix_rain(width: int, height: int, offset: float = 0) -> np.ndarray:
     Returns:
         Frame array with Matrix rain
     """
-    frame = np.zeros((height, width, 3), dtype=np.uint8)
-
     # Dark background with slight green tint
-    frame[:, :] = [0, 5, 0]
+    frame = np.full((height, width, 3), [0, 5, 0], dtype=np.uint8)
 
     # Create falling columns with randomized properties
     num_columns = width
@@ -1674,10 +1717,8 @@ def lava_lamp(width: int, height: int, offset: float = 0) -> np.ndarray:
     Returns:
         Frame array with lava lamp
     """
-    frame = np.zeros((height, width, 3), dtype=np.uint8)
-
     # Dark background
-    frame[:, :] = [10, 0, 20]
+    frame = np.full((height, width, 3), [10, 0, 20], dtype=np.uint8)
 
     # Simulate blobs with physics
     num_blobs = 6
@@ -1784,10 +1825,8 @@ def dna_helix(width: int, height: int, offset: float = 0) -> np.ndarray:
     Returns:
         Frame array with DNA helix
     """
-    frame = np.zeros((height, width, 3), dtype=np.uint8)
-
     # Dark background
-    frame[:, :] = [2, 2, 5]
+    frame = np.full((height, width, 3), [2, 2, 5], dtype=np.uint8)
 
     # Draw helix along vertical axis
     cx = width / 2.0
@@ -2185,10 +2224,8 @@ def fireworks(width: int, height: int, offset: float = 0) -> np.ndarray:
     Returns:
         Frame array with fireworks
     """
-    frame = np.zeros((height, width, 3), dtype=np.uint8)
-
     # Dark night sky
-    frame[:, :] = [0, 0, 1]
+    frame = np.full((height, width, 3), [0, 0, 1], dtype=np.uint8)
 
     # Multiple fireworks with randomized properties
     num_fireworks = 4
@@ -7,14 +7,11 @@ FastAPI server with REST + WebSocket endpoints and static file serving
 import logging
 import threading
 import queue
-import json
 import time
-import asyncio
-import numpy as np
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request, File, UploadFile
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
 from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
@@ -29,6 +26,30 @@ from . import test_patterns
 
 logger = logging.getLogger(__name__)
 
+# Generator frame period (~30 FPS)
+GENERATOR_FRAME_INTERVAL = 1.0 / 30.0
+
+
+def _wait_for_deadline(deadline: float, interval: float) -> Tuple[float, int]:
+    """
+    Sleep until a monotonic frame deadline and schedule the next one
+
+    Args:
+        deadline: time.monotonic() value the current frame is due at
+        interval: Frame period in seconds
+
+    Returns:
+        Tuple of (next deadline, number of frame slots missed)
+    """
+    now = time.monotonic()
+    if now < deadline:
+        time.sleep(deadline - now)
+        return deadline + interval, 0
+
+    # Running late: drop the missed frames instead of bursting to catch up
+    missed = int((now - deadline) // interval)
+    return deadline + interval * (missed + 1), missed
+
 
 # Pydantic models for API requests/responses
 class PanelUpdate(BaseModel):
@@ -126,6 +147,7 @@ class PatternGenerator:
     def _generate_loop(self) -> None:
         """Main generation loop (runs in background thread)"""
         try:
+            deadline = time.monotonic() + GENERATOR_FRAME_INTERVAL
             while self.running:
                 # Calculate animation offset based on frame count
                 offset = self.frame_count * 0.02  # Adjust speed here
@@ -144,10 +166,9 @@ class PatternGenerator:
                 except queue.Full:
                     logger.debug("Frame queue full, dropping pattern frame")
 
-                self.frame_count += 1
-
-                # Target ~30 FPS for patterns
-                time.sleep(1.0 / 30.0)
+                # Target ~30 FPS for patterns; missed frames still advance the animation
+                deadline, missed = _wait_for_deadline(deadline, GENERATOR_FRAME_INTERVAL)
+                self.frame_count += 1 + missed
 
         except Exception as e:
             logger.error(f"Pattern generator error: {e}", exc_info=True)
@@ -214,9 +235,8 @@ class SimulationGenerator:
     def _simulate_loop(self) -> None:
         """Main simulation loop (runs in background thread)"""
         try:
+            deadline = time.monotonic() + GENERATOR_FRAME_INTERVAL
             while self.running:
-                start_time = time.time()
-
                 # Render frame (at LED panel resolution)
                 frame = self.simulation.render_frame()
 
@@ -229,10 +249,7 @@ class SimulationGenerator:
                 self.frame_count += 1
 
                 # Maintain 30 FPS
-                elapsed = time.time() - start_time
-                target_time = 1.0 / 30.0
-                if elapsed < target_time:
-                    time.sleep(target_time - elapsed)
+                deadline, _ = _wait_for_deadline(deadline, GENERATOR_FRAME_INTERVAL)
 
         except Exception as e:
             logger.error(f"Simulation generator error: {e}", exc_info=True)
@@ -350,7 +367,8 @@ class WebAPIServer:
                     raise HTTPException(status_code=400, detail=f"Invalid configuration: {error_msg}")
 
                 # Save configuration
-                self.config_manager.save_config(new_config, self.config_path, create_backup=True)
+                self.config_manager.save_config(new_config, self.config_path, create_backup=True,
+                                                validated=True)
 
                 # Trigger reload
                 self.config_reload_event.set()
@@ -397,7 +415,8 @@ class WebAPIServer:
                 if not is_valid:
                     raise HTTPException(status_code=400, detail=f"Invalid configuration: {error_msg}")
 
-                self.config_manager.save_config(config, self.config_path, create_backup=True)
+                self.config_manager.save_config(config, self.config_path, create_backup=True,
+                                                validated=True)
 
                 # Trigger reload
                 self.config_reload_event.set()